@@ -1,5 +1,17 @@
 """Scout Bridge - High-performance communication with Scout SDK."""
 
-from .client import ScoutBridgeClient, ScoutBridgeError, get_bridge, shutdown_bridge
+from .client import (
+    ScoutBridgeClient,
+    ScoutBridgeConnectionError,
+    ScoutBridgeError,
+    get_bridge,
+    shutdown_bridge,
+)
 
-__all__ = ['ScoutBridgeClient', 'ScoutBridgeError', 'get_bridge', 'shutdown_bridge']
+__all__ = [
+    'ScoutBridgeClient',
+    'ScoutBridgeConnectionError',
+    'ScoutBridgeError',
+    'get_bridge',
+    'shutdown_bridge',
+]
@@ -26,16 +26,150 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, NamedTuple, Union
+
 
 logger = logging.getLogger(__name__)
 
+# OPTIMIZATION: Prefer msgspec, then orjson, then stdlib json.
+# - msgspec: one shared Encoder, and one shared Decoder built once for the
+#   response schema, so frames decode straight into typed structs instead of
+#   generic dicts probed with .get()
+# - orjson: parses/serializes in C and works on bytes directly
+try:
+    import msgspec
+
+    class _RpcResponse(msgspec.Struct):
+        """A single JSON-RPC response (or stream chunk) from the bridge."""
+        id: Optional[int] = None
+        result: Any = None
+        error: Optional[Dict[str, Any]] = None
+        chunk: Optional[str] = None
+
+    _encoder = msgspec.json.Encoder()
+    _decoder = msgspec.json.Decoder(Union[_RpcResponse, List[_RpcResponse]])
+
+    _dumps = _encoder.encode
+    _decode_response = _decoder.decode
+
+    def _dumps_into(obj: Any, buf: bytearray) -> None:
+        """Serialize obj directly onto the end of buf (no intermediate bytes)."""
+        _encoder.encode_into(obj, buf, -1)
+    _DecodeError = msgspec.DecodeError
+    HAS_MSGSPEC = True
+    HAS_ORJSON = False
+except ImportError:
+    HAS_MSGSPEC = False
+
+    try:
+        import orjson
+
+        _dumps = orjson.dumps
+        _loads = orjson.loads
+        HAS_ORJSON = True
+    except ImportError:
+        def _dumps(obj: Any) -> bytes:
+            return json.dumps(obj).encode()
+
+        _loads = json.loads
+        HAS_ORJSON = False
+
+    def _dumps_into(obj: Any, buf: bytearray) -> None:
+        """Serialize obj onto the end of buf."""
+        buf += _dumps(obj)
+
+    class _RpcResponse(NamedTuple):
+        """A single JSON-RPC response (or stream chunk) from the bridge."""
+        id: Optional[int] = None
+        result: Any = None
+        error: Optional[Dict[str, Any]] = None
+        chunk: Optional[str] = None
+
+    def _to_response(data: Dict[str, Any]) -> _RpcResponse:
+        return _RpcResponse(data.get('id'), data.get('result'), data.get('error'), data.get('chunk'))
+
+    def _decode_response(body: bytes) -> Union[_RpcResponse, List[_RpcResponse]]:
+        """Decode a response frame into the same shape the msgspec decoder produces."""
+        data = _loads(body)
+        if isinstance(data, list):
+            return [_to_response(item) for item in data]
+        if not isinstance(data, dict):
+            raise ValueError(f"unexpected JSON-RPC frame: {type(data).__name__}")
+        return _to_response(data)
+
+    _DecodeError = ValueError
+
+# Default location of the Node.js bridge script (ships alongside this module)
+DEFAULT_BRIDGE_SCRIPT = Path(__file__).parent / 'scout_bridge.mjs'
+
+
+# OPTIMIZATION: The constant head of each request frame is encoded once per
+# method, so only the id and params are serialized per call.
+_REQUEST_PREFIXES: Dict[str, bytes] = {}
+
+
+def _request_prefix(method: str) -> bytes:
+    """Get the pre-encoded `{"method":...,"id":` prefix for a method."""
+    prefix = _REQUEST_PREFIXES.get(method)
+    if prefix is None:
+        prefix = b'{"method":' + _dumps(method) + b',"id":'
+        _REQUEST_PREFIXES[method] = prefix
+    return prefix
+
+
+# Every message on the bridge's stdin/stdout is a 4-byte little-endian payload
+# length followed by that many bytes of JSON
+FRAME_HEADER_SIZE = 4
+
+
+def _encode_request_into(buf: bytearray, request_id: int, method: str, params: Dict[str, Any]) -> None:
+    """Append a JSON-RPC request object to buf."""
+    buf += _request_prefix(method)
+    buf += str(request_id).encode()
+    buf += b',"params":'
+    _dumps_into(params, buf)
+    buf += b'}'
+
+
+def _new_frame() -> bytearray:
+    """Start a frame buffer with room reserved for the length header."""
+    return bytearray(FRAME_HEADER_SIZE)
+
+
+def _finish_frame(buf: bytearray) -> bytearray:
+    """Fill in the length header of a frame built with _new_frame()."""
+    buf[:FRAME_HEADER_SIZE] = (len(buf) - FRAME_HEADER_SIZE).to_bytes(FRAME_HEADER_SIZE, 'little')
+    return buf
+
+
+def _encode_request_frame(request_id: int, method: str, params: Dict[str, Any]) -> bytearray:
+    """
+    Encode a complete request frame.
+
+    OPTIMIZATION: Header, prefix, id and params are written into a single
+    growing buffer (params via msgspec's encode_into when available) instead of
+    serializing to separate bytes objects and concatenating them.
+    """
+    buf = _new_frame()
+    _encode_request_into(buf, request_id, method, params)
+    return _finish_frame(buf)
+
+
+def scout_root_for(bridge_script_path) -> Path:
+    """Get the Scout root directory for a bridge script path."""
+    return Path(bridge_script_path).parent.parent.parent.parent
+
 
 class ScoutBridgeError(Exception):
     """Error communicating with Scout bridge."""
     pass
 
 
+class ScoutBridgeConnectionError(ScoutBridgeError):
+    """The pipe to the bridge process broke (process died or closed its stdio)."""
+    pass
+
+
 class ScoutBridgeClient:
     """
     Client for communicating with the persistent Scout bridge process.
@@ -45,8 +179,23 @@ class ScoutBridgeClient:
     - All requests reuse the same Node.js process and loaded Scout SDK
     - Eliminates ~1-3s of process startup overhead per query
     - JSON-RPC protocol is lightweight and efficient
+    - Requests are demultiplexed by id: a single writer task batches queued
+      requests into one write + drain, a single reader task resolves responses
     """
 
+    # Upper bounds on how much the writer task coalesces into a single write
+    MAX_WRITE_BATCH = 64
+    MAX_WRITE_BATCH_BYTES = 1 << 20
+
+    # StreamReader buffer for the bridge pipes (asyncio default is 64 KB).
+    # Large agent responses fit in one buffer instead of bouncing through
+    # many small reads.
+    STREAM_BUFFER_LIMIT = 1 << 20
+
+    # How long the writer task waits for more requests to arrive before
+    # flushing, so bursts of concurrent calls share a single write
+    BATCH_WINDOW = float(os.getenv('SCOUT_BRIDGE_BATCH_WINDOW_MS', '2')) / 1000
+
     def __init__(self, bridge_script_path: Optional[str] = None):
         """Initialize Scout bridge client.
 
@@ -56,12 +205,31 @@ class ScoutBridgeClient:
         self.bridge_script_path = bridge_script_path or self._get_default_bridge_path()
         self.process: Optional[asyncio.subprocess.Process] = None
         self.request_id = 0
-        self.lock = asyncio.Lock()
         self._initialized = False
+        self._start_lock = asyncio.Lock()
+
+        # In-flight requests awaiting a response
+        # Maps: request id -> future resolved by the reader task
+        self._pending: Dict[int, asyncio.Future] = {}
+        # Streaming requests (see query_stream)
+        # Maps: request id -> queue of output chunks, None once the request ends
+        self._streams: Dict[int, asyncio.Queue] = {}
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
 
     def _get_default_bridge_path(self) -> str:
         """Get the default path to the bridge script."""
-        return str(Path(__file__).parent / 'scout_bridge.mjs')
+        return str(DEFAULT_BRIDGE_SCRIPT)
+
+    @property
+    def scout_root(self) -> Path:
+        """Scout root directory (3 levels up from the bridge script's directory).
+
+        The bridge runs with this as its cwd so project agents can be found.
+        """
+        return scout_root_for(self.bridge_script_path)
 
     async def start(self):
         """
@@ -69,9 +237,30 @@ class ScoutBridgeClient:
 
         OPTIMIZATION: This is called once at MCP server startup, not per-query.
         The bridge process stays alive for the entire server lifetime.
+
+        Idempotent and safe to call concurrently: callers serialize on a lock and
+        only the first one spawns the Node.js process.
         """
-        if self._initialized and self.process:
-            return
+        async with self._start_lock:
+            if self._initialized and self.process:
+                return
+            await self._spawn()
+
+    async def _restart(self):
+        """Replace a dead bridge process with a fresh one."""
+        async with self._start_lock:
+            if self._initialized and self.process and self.process.returncode is None:
+                # Another caller already restarted it
+                return
+            logger.warning("[Scout Bridge] Bridge connection lost, restarting")
+            await self._shutdown()
+            await self._spawn()
+
+    async def _spawn(self):
+        """Spawn the bridge process and its I/O tasks. Caller holds _start_lock."""
+        if self.process:
+            # Reap a dead process and its tasks before spawning a replacement
+            await self._shutdown()
 
         if not os.path.exists(self.bridge_script_path):
             raise ScoutBridgeError(
@@ -81,8 +270,7 @@ class ScoutBridgeClient:
         try:
             # Start the Node.js bridge as a persistent subprocess
             # Set cwd to Scout root (3 levels up from bridge script) so agents can be found
-            bridge_dir = Path(self.bridge_script_path).parent
-            scout_root = bridge_dir.parent.parent.parent
+            scout_root = self.scout_root
 
             self.process = await asyncio.create_subprocess_exec(
                 'node',
@@ -91,44 +279,81 @@ class ScoutBridgeClient:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=str(scout_root),
+                limit=self.STREAM_BUFFER_LIMIT,
             )
 
             # Wait for ready signal on stderr
             ready_task = asyncio.create_task(self._wait_for_ready())
             await asyncio.wait_for(ready_task, timeout=30.0)
 
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
+            self._reader_task = asyncio.create_task(self._reader_loop())
+            self._stderr_task = asyncio.create_task(self._drain_stderr())
+
             self._initialized = True
             logger.info("[Scout Bridge] Started successfully")
 
         except asyncio.TimeoutError:
-            await self.stop()
+            await self._shutdown()
             raise ScoutBridgeError(
                 "Scout bridge failed to start within 30 seconds. "
                 "Check that Node.js and swarm-scout are installed."
             )
         except Exception as e:
-            await self.stop()
+            await self._shutdown()
             raise ScoutBridgeError(f"Failed to start Scout bridge: {e}")
 
     async def _wait_for_ready(self):
-        """Wait for the bridge to signal it's ready."""
-        while True:
-            line = await self.process.stderr.readline()
-            if not line:
-                raise ScoutBridgeError("Bridge process exited unexpectedly")
+        """
+        Wait for the bridge to signal it's ready.
+
+        OPTIMIZATION: A single readuntil() scans the raw stderr buffer for the
+        marker instead of decoding and searching every line in Python.
+        """
+        try:
+            startup_output = await self.process.stderr.readuntil(b'Ready')
+        except asyncio.IncompleteReadError:
+            raise ScoutBridgeError("Bridge process exited unexpectedly")
+        logger.debug(f"[Scout Bridge] {startup_output.decode(errors='replace').strip()}")
 
-            message = line.decode().strip()
-            logger.debug(f"[Scout Bridge] {message}")
+    async def _drain_stderr(self):
+        """
+        Keep draining the bridge's stderr after startup.
 
-            if 'Ready' in message:
+        If nobody reads it, the pipe buffer fills up and the Node process blocks
+        on its next console.error(), stalling every in-flight request.
+        """
+        stderr = self.process.stderr
+        while True:
+            line = await stderr.readline()
+            if not line:
                 return
+            logger.debug(f"[Scout Bridge] {line.decode(errors='replace').rstrip()}")
 
     async def stop(self):
         """Stop the Scout bridge process gracefully."""
+        async with self._start_lock:
+            await self._shutdown()
+
+    async def _shutdown(self):
+        """Stop the I/O tasks and the bridge process. Caller holds _start_lock."""
+        for task in (self._writer_task, self._reader_task, self._stderr_task):
+            if task is not None:
+                task.cancel()
+        self._writer_task = None
+        self._reader_task = None
+        self._stderr_task = None
+        self._write_queue = None
+        self._fail_pending(ScoutBridgeError("Bridge stopped"))
+
         if self.process:
             try:
-                self.process.terminate()
+                if self.process.returncode is None:
+                    self.process.terminate()
                 await asyncio.wait_for(self.process.wait(), timeout=5.0)
+            except ProcessLookupError:
+                pass
             except asyncio.TimeoutError:
                 self.process.kill()
                 await self.process.wait()
@@ -137,6 +362,115 @@ class ScoutBridgeClient:
                 self._initialized = False
             logger.info("[Scout Bridge] Stopped")
 
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every in-flight request with the given error."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def _writer_loop(self):
+        """
+        Drain the write queue, coalescing queued requests into one write.
+
+        OPTIMIZATION: Under concurrent load, N requests cost one write() and one
+        drain() instead of N of each. After the first request arrives the writer
+        waits up to BATCH_WINDOW for more, so requests issued within a couple of
+        milliseconds of each other are coalesced transparently.
+
+        Coalesced requests stay individual frames rather than being merged into
+        a JSON-RPC batch, so a quick call never waits on a slow neighbour's
+        response. Use batch() when the caller wants all results together.
+        """
+        queue = self._write_queue
+        stdin = self.process.stdin
+        loop = asyncio.get_running_loop()
+        while True:
+            payload = await queue.get()
+            chunks = [payload]
+            size = len(payload)
+            deadline = loop.time() + self.BATCH_WINDOW
+            while len(chunks) < self.MAX_WRITE_BATCH and size < self.MAX_WRITE_BATCH_BYTES:
+                if queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        payload = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    payload = queue.get_nowait()
+                chunks.append(payload)
+                size += len(payload)
+
+            try:
+                stdin.writelines(chunks)
+                await stdin.drain()
+            except Exception as e:
+                # If communication fails, assume bridge is dead and needs restart
+                self._initialized = False
+                self._fail_pending(ScoutBridgeConnectionError(f"Bridge communication error: {e}"))
+                return
+
+    async def _reader_loop(self):
+        """
+        Read response frames from the bridge and resolve the matching request futures.
+
+        OPTIMIZATION: Length-prefixed frames are read with two readexactly()
+        calls - no scanning for a newline through tens of KB of agent output,
+        and the body is handed to the JSON parser as a single bytes object.
+        """
+        stdout = self.process.stdout
+        while True:
+            try:
+                header = await stdout.readexactly(FRAME_HEADER_SIZE)
+                body = await stdout.readexactly(int.from_bytes(header, 'little'))
+            except asyncio.IncompleteReadError:
+                self._initialized = False
+                self._fail_pending(ScoutBridgeConnectionError("Bridge process closed unexpectedly"))
+                return
+            except Exception as e:
+                self._initialized = False
+                self._fail_pending(ScoutBridgeConnectionError(f"Bridge communication error: {e}"))
+                return
+
+            try:
+                response = _decode_response(body)
+            except _DecodeError as e:
+                logger.warning(f"[Scout Bridge] Invalid JSON response from bridge: {e}")
+                continue
+
+            # A JSON-RPC batch is answered with an array of responses
+            if isinstance(response, list):
+                for item in response:
+                    self._resolve(item)
+            else:
+                self._resolve(response)
+
+    def _resolve(self, response: _RpcResponse) -> None:
+        """Resolve the pending request matching a single response object."""
+        if response.chunk is not None:
+            # Partial output of a streaming request; the request stays pending
+            queue = self._streams.get(response.id)
+            if queue is not None:
+                queue.put_nowait(response.chunk)
+            return
+
+        future = self._pending.pop(response.id, None)
+        if future is None:
+            # Unparseable request on the bridge side (id: null) or a late reply
+            logger.warning(f"[Scout Bridge] Unmatched response: {response.error or response.id}")
+            return
+        if future.done():
+            return
+
+        if response.error is not None:
+            error_msg = response.error.get('message', 'Unknown error')
+            future.set_exception(ScoutBridgeError(f"Bridge error: {error_msg}"))
+        else:
+            future.set_result(response.result if response.result is not None else {})
+
     async def _send_request(
         self,
         method: str,
@@ -145,10 +479,17 @@ class ScoutBridgeClient:
         """
         Send a JSON-RPC request to the bridge.
 
-        PROTOCOL:
+        PROTOCOL (each message is framed as a 4-byte LE length + JSON):
         - Request:  {"id": 1, "method": "query", "params": {...}}
         - Response: {"id": 1, "result": {...}} OR {"id": 1, "error": {...}}
 
+        Requests are not serialized: each one is queued for the writer task and
+        resolved by id when the reader task sees its response, so responses may
+        arrive in any order.
+
+        If the bridge process died (broken pipe / closed stdout), it is
+        restarted and the request is retried once.
+
         Args:
             method: RPC method name
             params: Method parameters
@@ -159,52 +500,81 @@ class ScoutBridgeClient:
         Raises:
             ScoutBridgeError: If the request fails
         """
+        for attempt in range(2):
+            if not self.process or not self._initialized:
+                await self.start()
+
+            request_id, future = self._register_request()
+            self._write_queue.put_nowait(_encode_request_frame(request_id, method, params))
+
+            try:
+                return await future
+            except ScoutBridgeConnectionError:
+                if attempt:
+                    raise
+                await self._restart()
+            finally:
+                self._pending.pop(request_id, None)
+
+    def _register_request(self) -> Tuple[int, asyncio.Future]:
+        """Allocate a fresh request id and register its response future."""
+        self.request_id += 1
+        request_id = self.request_id
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        return request_id, future
+
+    async def batch(
+        self,
+        requests: List[Tuple[str, Dict[str, Any]]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Send several requests as a single JSON-RPC batch.
+
+        PROTOCOL:
+        - Request:  [{"id": 1, "method": ..., "params": ...}, {"id": 2, ...}]
+        - Response: [{"id": 1, "result": ...}, {"id": 2, "error": ...}]
+
+        The bridge runs the handlers concurrently and replies once all of them
+        have finished, so the whole batch costs a single round-trip.
+
+        Args:
+            requests: List of (method, params) pairs
+            return_exceptions: If True, failed requests yield their ScoutBridgeError
+                               in the result list instead of raising
+
+        Returns:
+            Results in the same order as the requests
+
+        Raises:
+            ScoutBridgeError: If any request fails and return_exceptions is False
+        """
+        if not requests:
+            return []
+
         if not self.process or not self._initialized:
             await self.start()
 
-        async with self.lock:
-            self.request_id += 1
-            request_id = self.request_id
-
-            request = {
-                'id': request_id,
-                'method': method,
-                'params': params
-            }
+        entries = [self._register_request() for _ in requests]
+        buf = _new_frame()
+        buf += b'['
+        for index, ((request_id, _), (method, params)) in enumerate(zip(entries, requests)):
+            if index:
+                buf += b','
+            _encode_request_into(buf, request_id, method, params)
+        buf += b']'
+        self._write_queue.put_nowait(_finish_frame(buf))
 
-            try:
-                # Send request
-                request_json = json.dumps(request) + '\n'
-                self.process.stdin.write(request_json.encode())
-                await self.process.stdin.drain()
-
-                # Read response
-                response_line = await self.process.stdout.readline()
-                if not response_line:
-                    raise ScoutBridgeError("Bridge process closed unexpectedly")
-
-                response = json.loads(response_line.decode())
-
-                # Check for errors
-                if 'error' in response:
-                    error_msg = response['error'].get('message', 'Unknown error')
-                    raise ScoutBridgeError(f"Bridge error: {error_msg}")
-
-                # Verify response ID matches
-                if response.get('id') != request_id:
-                    raise ScoutBridgeError(
-                        f"Response ID mismatch: expected {request_id}, "
-                        f"got {response.get('id')}"
-                    )
-
-                return response.get('result', {})
-
-            except json.JSONDecodeError as e:
-                raise ScoutBridgeError(f"Invalid JSON response from bridge: {e}")
-            except Exception as e:
-                # If communication fails, assume bridge is dead and needs restart
-                self._initialized = False
-                raise ScoutBridgeError(f"Bridge communication error: {e}")
+        try:
+            return await asyncio.gather(
+                *(future for _, future in entries),
+                return_exceptions=return_exceptions
+            )
+        finally:
+            for request_id, _ in entries:
+                self._pending.pop(request_id, None)
 
     async def query(
         self,
@@ -218,6 +588,7 @@ class ScoutBridgeClient:
         Execute a Scout query.
 
         PERFORMANCE: This is ~100x faster than spawning `scout query` subprocess.
+        Results are not cached here - the scout_query tool caches its responses.
 
         Args:
             query: Natural language query
@@ -241,6 +612,68 @@ class ScoutBridgeClient:
         result = await self._send_request('query', params)
         return result.get('output', '')
 
+    async def query_stream(
+        self,
+        query: str,
+        cwd: str = '.',
+        model: Optional[str] = None,
+        verbose: bool = False,
+        timeout: int = 300
+    ) -> AsyncIterator[str]:
+        """
+        Execute a Scout query, yielding output text as the bridge produces it.
+
+        PROTOCOL: The bridge answers a `"stream": true` query with any number of
+        {"id": N, "chunk": "..."} frames followed by the usual final response.
+
+        PERFORMANCE: Callers can start consuming output while the model is still
+        generating, and neither side has to hold the whole answer in one buffer.
+        Streamed queries are not retried (output may already have been consumed).
+
+        Args:
+            query: Natural language query
+            cwd: Working directory
+            model: LLM model to use (optional)
+            verbose: Enable verbose output
+            timeout: Timeout in seconds
+
+        Yields:
+            Chunks of query result text
+
+        Raises:
+            ScoutBridgeError: If the query fails
+        """
+        params = {
+            'query': query,
+            'cwd': cwd,
+            'verbose': verbose,
+            'timeout': timeout,
+            'stream': True,
+        }
+        if model:
+            params['model'] = model
+
+        if not self.process or not self._initialized:
+            await self.start()
+
+        request_id, future = self._register_request()
+        chunks: asyncio.Queue = asyncio.Queue()
+        self._streams[request_id] = chunks
+        # Wake the consumer however the request ends (result, error, dead bridge)
+        future.add_done_callback(lambda _: chunks.put_nowait(None))
+        self._write_queue.put_nowait(_encode_request_frame(request_id, 'query', params))
+
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is None:
+                    break
+                yield chunk
+            await future
+        finally:
+            self._pending.pop(request_id, None)
+            self._streams.pop(request_id, None)
+
     async def invoke_agent(
         self,
         agent_id: str,
@@ -276,7 +709,11 @@ class ScoutBridgeClient:
         result = await self._send_request('agent.invoke', params)
         return result.get('output', '')
 
-    async def list_agents(self, cwd: str = '.') -> Dict[str, List[Dict[str, str]]]:
+    async def list_agents(
+        self,
+        cwd: str = '.',
+        if_none_match: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         List all available agents.
 
@@ -284,11 +721,17 @@ class ScoutBridgeClient:
 
         Args:
             cwd: Working directory
+            if_none_match: Version token from a previous result. If the agent
+                           list still has this version, the bridge skips
+                           serializing it and returns {'unchanged': True, 'version': ...}
 
         Returns:
-            Dict with 'global' and 'project' agent lists
+            Dict with 'global' and 'project' agent lists and their 'version'
         """
-        result = await self._send_request('agent.list', {'cwd': cwd})
+        params = {'cwd': cwd}
+        if if_none_match:
+            params['ifNoneMatch'] = if_none_match
+        result = await self._send_request('agent.list', params)
         return result
 
     async def ping(self) -> bool:
@@ -304,6 +747,27 @@ class ScoutBridgeClient:
         except:
             return False
 
+    async def warmup(self, attempts: int = 4, initial_delay: float = 0.25) -> None:
+        """
+        Make sure the bridge is up and answering before serving requests.
+
+        Pings with exponential backoff (0.25s, 0.5s, 1s, ...) so a slow or
+        broken Node.js setup fails fast at server startup instead of adding
+        spawn latency - or an error - to the first MCP request.
+
+        Raises:
+            ScoutBridgeError: If the bridge never answers
+        """
+        delay = initial_delay
+        for attempt in range(attempts):
+            if await self.ping():
+                return
+            if attempt + 1 < attempts:
+                logger.warning(f"[Scout Bridge] Ping failed, retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                delay *= 2
+        raise ScoutBridgeError(f"Scout bridge did not respond after {attempts} attempts")
+
     async def __aenter__(self):
         """Context manager entry."""
         await self.start()
@@ -315,8 +779,17 @@ class ScoutBridgeClient:
 
 
 # Global singleton instance for the MCP server
-# OPTIMIZATION: Single bridge instance shared across all tool invocations
-_global_bridge: Optional[ScoutBridgeClient] = None
+# OPTIMIZATION: Single bridge instance shared across all tool invocations.
+# Held as a Task so concurrent first callers all await the same startup
+# instead of racing to spawn their own Node.js process.
+_bridge_task: Optional["asyncio.Task[ScoutBridgeClient]"] = None
+
+
+async def _start_bridge() -> ScoutBridgeClient:
+    """Create and start a bridge client."""
+    client = ScoutBridgeClient()
+    await client.start()
+    return client
 
 
 async def get_bridge() -> ScoutBridgeClient:
@@ -326,16 +799,36 @@ async def get_bridge() -> ScoutBridgeClient:
     OPTIMIZATION: This ensures we only have one bridge process for the entire
     MCP server lifetime, maximizing the performance benefit.
     """
-    global _global_bridge
-    if _global_bridge is None:
-        _global_bridge = ScoutBridgeClient()
-        await _global_bridge.start()
-    return _global_bridge
+    global _bridge_task
+    task = _bridge_task
+    if task is not None and task.done() and not task.cancelled() and task.exception() is None:
+        # Hot path: the bridge is already up
+        return task.result()
+
+    if task is None:
+        task = _bridge_task = asyncio.create_task(_start_bridge())
+
+    try:
+        # shield: a caller being cancelled must not abort the shared startup
+        return await asyncio.shield(task)
+    except BaseException:
+        # Startup failed - forget the task so the next caller retries
+        if task.done() and _bridge_task is task:
+            _bridge_task = None
+        raise
 
 
 async def shutdown_bridge():
     """Shutdown the global bridge instance."""
-    global _global_bridge
-    if _global_bridge is not None:
-        await _global_bridge.stop()
-        _global_bridge = None
+    global _bridge_task
+    task, _bridge_task = _bridge_task, None
+    if task is None:
+        return
+
+    if not task.done():
+        task.cancel()
+    try:
+        client = await task
+    except (asyncio.CancelledError, Exception):
+        return
+    await client.stop()
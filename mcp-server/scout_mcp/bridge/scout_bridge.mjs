@@ -10,15 +10,26 @@
  * ARCHITECTURE:
  * - Runs as a persistent Node.js process
  * - Imports Scout's TypeScript SDK directly (no CLI overhead)
- * - Communicates via JSON-RPC over stdin/stdout
+ * - Communicates via length-prefixed JSON-RPC over stdin/stdout
  * - Handles queries, agent invocations, and agent listing
  *
  * PROTOCOL:
+ * Framing:  every message is a 4-byte little-endian byte length + UTF-8 JSON payload
  * Request:  {"id": 1, "method": "query"|"agent.invoke"|"agent.list", "params": {...}}
  * Response: {"id": 1, "result": {...}} OR {"id": 1, "error": {...}}
+ *
+ * Batch:    [{"id": 1, ...}, {"id": 2, ...}] -> [{"id": 1, ...}, {"id": 2, ...}]
+ *           Handlers run concurrently; one array response is written once all finish.
+ *
+ * Concurrency: handlers share the process working directory and the Scout
+ *           client's model. Requests needing the same cwd/model overlap freely;
+ *           a request needing a different one waits for those to finish (FIFO).
+ *
+ * Stream:   a query with params.stream = true first emits {"id": 1, "chunk": "..."}
+ *           frames as text is generated, then the final {"id": 1, "result": {...}}.
  */
 
-import { createInterface } from 'readline';
+import { createHash } from 'crypto';
 import { CeregrepClient as ScoutClient } from 'swarm-scout/sdk';
 import { getTools, getConfig } from 'swarm-scout';
 // Use relative imports for non-exported modules (bridge is in Scout repo)
@@ -29,6 +40,32 @@ import { createAgentClientConfig } from '../../../dist/agents/config-merger.js';
 // Global Scout client instance (initialized lazily)
 let scoutClient = null;
 
+const FRAME_HEADER_SIZE = 4;
+
+// Working directory the bridge was started in (used when a request names none)
+const launchCwd = process.cwd();
+
+// Process-wide state lease: which cwd/model key currently holds the process,
+// how many handlers run under it, and the requests queued for another key
+let stateKey = null;
+let stateHolders = 0;
+const stateWaiters = [];
+
+// stdout carries binary frames only - keep stray console.log output from
+// the SDK (or anything else) from corrupting the stream
+const stdoutWrite = process.stdout.write.bind(process.stdout);
+console.log = console.error;
+
+/**
+ * Write one length-prefixed JSON message to stdout
+ */
+function writeFrame(message) {
+  const body = Buffer.from(JSON.stringify(message), 'utf8');
+  const header = Buffer.allocUnsafe(FRAME_HEADER_SIZE);
+  header.writeUInt32LE(body.length, 0);
+  stdoutWrite(Buffer.concat([header, body], FRAME_HEADER_SIZE + body.length));
+}
+
 /**
  * Initialize Scout client with default tools
  * OPTIMIZATION: Client is initialized once and reused for all queries
@@ -41,38 +78,113 @@ async function getScoutClient() {
   return scoutClient;
 }
 
+/**
+ * Run fn with the process switched to the given working directory (and model
+ * for the shared client).
+ *
+ * process.chdir() and client.setModel() are process-wide, so pipelined and
+ * batched requests would otherwise switch state underneath each other. Holders
+ * of the same state share it; a different state waits until they have all
+ * finished, and arrivals queue behind a waiter so it cannot starve.
+ * @param {string|undefined} cwd - Working directory (defaults to the launch cwd)
+ * @param {string|undefined} model - Model for the shared Scout client
+ * @param {Function} fn - Async function run while the state is held
+ */
+async function withProcessState(cwd, model, fn) {
+  const dir = cwd || launchCwd;
+  const key = JSON.stringify([dir, model || null]);
+
+  if (stateHolders === 0 || (key === stateKey && stateWaiters.length === 0)) {
+    stateKey = key;
+    stateHolders++;
+  } else {
+    // Granted by releaseProcessState() once the current holders finish
+    await new Promise((resolve) => stateWaiters.push({ key, resolve }));
+  }
+
+  try {
+    if (process.cwd() !== dir) {
+      process.chdir(dir);
+    }
+    if (model) {
+      (await getScoutClient()).setModel(model);
+    }
+    return await fn();
+  } finally {
+    releaseProcessState();
+  }
+}
+
+/**
+ * Drop one hold on the process state; when the last holder leaves, hand the
+ * process to the oldest waiter and every other waiter needing the same state.
+ */
+function releaseProcessState() {
+  if (--stateHolders > 0) return;
+
+  if (stateWaiters.length === 0) {
+    stateKey = null;
+    process.chdir(launchCwd);
+    return;
+  }
+
+  stateKey = stateWaiters[0].key;
+  for (let i = 0; i < stateWaiters.length; ) {
+    if (stateWaiters[i].key === stateKey) {
+      stateHolders++;
+      stateWaiters.splice(i, 1)[0].resolve();
+    } else {
+      i++;
+    }
+  }
+}
+
 /**
  * Handle query request
- * @param {Object} params - {query: string, cwd?: string, model?: string, verbose?: boolean, timeout?: number}
+ * @param {Object} params - {query: string, cwd?: string, model?: string, verbose?: boolean, timeout?: number, stream?: boolean}
+ * @param {Function} onChunk - Called with each piece of output text when streaming
  */
-async function handleQuery(params) {
-  const { query, cwd, model, verbose, timeout } = params;
+async function handleQuery(params, onChunk) {
+  const { query, cwd, model, verbose, timeout, stream } = params;
 
   if (!query) {
     throw new Error('query parameter is required');
   }
 
-  // Change working directory if specified
-  const originalCwd = process.cwd();
-  if (cwd) {
-    process.chdir(cwd);
-  }
-
-  try {
-    // Get Scout client
+  return withProcessState(cwd, model, async () => {
+    // Get Scout client (model already applied)
     const client = await getScoutClient();
 
-    // Set model if specified
-    if (model) {
-      client.setModel(model);
-    }
-
     // Execute query with timeout
     const timeoutMs = timeout ? timeout * 1000 : 300000; // Default 5 minutes
     const abortController = new AbortController();
     const timeoutId = setTimeout(() => abortController.abort(), timeoutMs);
 
     try {
+      // Streaming: forward assistant text as it arrives instead of buffering
+      if (stream) {
+        for await (const message of client.queryStream([], query, {
+          verbose: verbose || false,
+          abortController,
+          dangerouslySkipPermissions: true,
+        })) {
+          if (message.type !== 'assistant') continue;
+          const content = message.message.content;
+          if (Array.isArray(content)) {
+            for (const block of content) {
+              if (block.type === 'text') {
+                onChunk(block.text + '\n');
+              }
+            }
+          } else if (typeof content === 'string') {
+            onChunk(content + '\n');
+          }
+        }
+
+        clearTimeout(timeoutId);
+        return { streamed: true };
+      }
+
       // Collect all messages
       const messages = [];
       for await (const message of client.queryStream([], query, {
@@ -113,12 +225,7 @@ async function handleQuery(params) {
       }
       throw error;
     }
-  } finally {
-    // Restore original working directory
-    if (cwd) {
-      process.chdir(originalCwd);
-    }
-  }
+  });
 }
 
 /**
@@ -132,13 +239,8 @@ async function handleAgentInvoke(params) {
     throw new Error('agentId and prompt parameters are required');
   }
 
-  // Change working directory if specified
-  const originalCwd = process.cwd();
-  if (cwd) {
-    process.chdir(cwd);
-  }
-
-  try {
+  // Model goes into this agent's own client config, not the shared client
+  return withProcessState(cwd, undefined, async () => {
     // Load agent config
     const agent = await getAgent(agentId);
     if (!agent) {
@@ -192,28 +294,20 @@ async function handleAgentInvoke(params) {
       output: output.trim(),
       messages, // Include full message history for debugging
     };
-  } finally {
-    // Restore original working directory
-    if (cwd) {
-      process.chdir(originalCwd);
-    }
-  }
+  });
 }
 
 /**
  * Handle agent list request
- * @param {Object} params - {cwd?: string}
+ * @param {Object} params - {cwd?: string, ifNoneMatch?: string}
+ *
+ * The result carries a content version; when the caller already holds that
+ * version, only {unchanged: true, version} is sent back.
  */
 async function handleAgentList(params) {
-  const { cwd } = params || {};
-
-  // Change working directory if specified
-  const originalCwd = process.cwd();
-  if (cwd) {
-    process.chdir(cwd);
-  }
+  const { cwd, ifNoneMatch } = params || {};
 
-  try {
+  return withProcessState(cwd, undefined, async () => {
     const agents = await listAgents();
 
     // Combine global and project agents with metadata
@@ -230,13 +324,17 @@ async function handleAgentList(params) {
       })),
     };
 
-    return result;
-  } finally {
-    // Restore original working directory
-    if (cwd) {
-      process.chdir(originalCwd);
+    const version = createHash('sha1')
+      .update(JSON.stringify(result))
+      .digest('hex')
+      .slice(0, 16);
+
+    if (ifNoneMatch && ifNoneMatch === version) {
+      return { unchanged: true, version };
     }
-  }
+
+    return { ...result, version };
+  });
 }
 
 /**
@@ -250,7 +348,7 @@ async function processRequest(request) {
 
     switch (method) {
       case 'query':
-        result = await handleQuery(params);
+        result = await handleQuery(params, (chunk) => writeFrame({ id, chunk }));
         break;
 
       case 'agent.invoke':
@@ -288,40 +386,51 @@ async function main() {
   // Write ready signal to stderr (stdout is for JSON-RPC)
   console.error('[Scout Bridge] Ready - accepting JSON-RPC requests on stdin');
 
-  const rl = createInterface({
-    input: process.stdin,
-    output: process.stdout,
-    terminal: false,
-  });
+  // Reassemble length-prefixed frames from stdin chunks
+  let pending = Buffer.alloc(0);
 
-  rl.on('line', async (line) => {
+  async function handleFrame(body) {
     try {
-      const request = JSON.parse(line);
-      const response = await processRequest(request);
-      // Write response to stdout (one line per response)
-      console.log(JSON.stringify(response));
+      const request = JSON.parse(body.toString('utf8'));
+
+      // JSON-RPC batch: run all handlers concurrently and reply with one array
+      if (Array.isArray(request)) {
+        writeFrame(await Promise.all(request.map(processRequest)));
+        return;
+      }
+
+      writeFrame(await processRequest(request));
     } catch (error) {
       // Invalid JSON or processing error
-      console.log(JSON.stringify({
+      writeFrame({
         id: null,
         error: {
           message: `Bridge error: ${error.message}`,
           stack: error.stack,
         },
-      }));
+      });
+    }
+  }
+
+  process.stdin.on('data', (data) => {
+    pending = pending.length ? Buffer.concat([pending, data]) : data;
+    while (pending.length >= FRAME_HEADER_SIZE) {
+      const length = pending.readUInt32LE(0);
+      if (pending.length < FRAME_HEADER_SIZE + length) break;
+      const body = pending.subarray(FRAME_HEADER_SIZE, FRAME_HEADER_SIZE + length);
+      pending = pending.subarray(FRAME_HEADER_SIZE + length);
+      handleFrame(body);
     }
   });
 
   // Handle graceful shutdown
   process.on('SIGTERM', () => {
     console.error('[Scout Bridge] Shutting down gracefully...');
-    rl.close();
     process.exit(0);
   });
 
   process.on('SIGINT', () => {
     console.error('[Scout Bridge] Interrupted - shutting down...');
-    rl.close();
     process.exit(0);
   });
 }
@@ -0,0 +1,181 @@
+"""
+Small in-memory caches used by the Scout tools.
+
+OPTIMIZATION: Scout queries cost seconds of LLM latency, but agent loops often
+repeat the exact same query against an unchanged repository. A bounded TTL
+cache turns those repeats into dictionary lookups.
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded LRU mapping whose entries expire after a time-to-live.
+
+    Entries may override the default TTL (e.g. short-lived negative entries).
+    Expired entries are dropped lazily when looked up or when the cache is full.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Maps: key -> (expiry timestamp, value), ordered least -> most recently used
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a live entry, refreshing its LRU position."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used one when full."""
+        if self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+@functools.cache
+def _load_encoder(model_name: str):
+    """Load a sentence-transformers model once per process (slow: seconds)."""
+    # Imported here - sentence_transformers pulls in torch
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+class SemanticCache:
+    """
+    Maps near-paraphrase queries onto keys of an exact-match cache.
+
+    OPTIMIZATION: Agents rephrase the same question ("find async funcs" vs
+    "list async functions"), which an exact-match cache always misses. Each
+    query is embedded with a small local model; a new query whose cosine
+    similarity to a past one exceeds the threshold reuses that query's key.
+    Embeddings are unit-normalized, so the similarity against every past query
+    in the scope is one matrix-vector product.
+
+    Requires numpy and sentence-transformers (the `semantic` extra); the
+    constructor raises ImportError without numpy, the first embed() without
+    sentence-transformers.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.95,
+        maxsize: int = 512,
+        max_scopes: int = 64,
+    ):
+        import numpy
+
+        self._np = numpy
+        self.model_name = model_name
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.max_scopes = max_scopes
+        # Maps: scope -> (embedding matrix, one row per key; keys), least -> most recently used
+        self._scopes: "OrderedDict[Hashable, Tuple[Any, List[Hashable]]]" = OrderedDict()
+
+    async def embed(self, text: str) -> Any:
+        """Embed text as a unit vector (off the event loop - the model is CPU-bound)."""
+        return await asyncio.to_thread(self._embed, text)
+
+    def _embed(self, text: str) -> Any:
+        encoder = _load_encoder(self.model_name)
+        return encoder.encode(text, normalize_embeddings=True, convert_to_numpy=True)
+
+    def match(self, scope: Hashable, embedding: Any) -> Optional[Hashable]:
+        """Get the key of the most similar past query in scope, if similar enough."""
+        entry = self._scopes.get(scope)
+        if entry is None:
+            return None
+        matrix, keys = entry
+        similarities = matrix @ embedding
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        self._scopes.move_to_end(scope)
+        return keys[best]
+
+    def add(self, scope: Hashable, embedding: Any, key: Hashable) -> None:
+        """Record a query embedding and the exact-match key its response is stored under."""
+        entry = self._scopes.get(scope)
+        if entry is None:
+            matrix, keys = embedding[None, :], [key]
+        else:
+            matrix = self._np.vstack((entry[0], embedding))[-self.maxsize:]
+            keys = (entry[1] + [key])[-self.maxsize:]
+        self._scopes[scope] = (matrix, keys)
+        self._scopes.move_to_end(scope)
+        while len(self._scopes) > self.max_scopes:
+            self._scopes.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all embeddings."""
+        self._scopes.clear()
+
+    def __len__(self) -> int:
+        return sum(len(keys) for _, keys in self._scopes.values())
+
+
+GIT_HEAD_TTL = 5.0
+# Upper bound on working directories whose HEAD is remembered
+GIT_HEAD_CACHE_SIZE = 256
+
+# Git HEAD per working directory
+# Maps: cwd -> HEAD sha (None outside a git repo)
+_git_heads = TTLCache(GIT_HEAD_CACHE_SIZE, GIT_HEAD_TTL)
+# Distinguishes "not cached" from a cached None
+_MISSING = object()
+
+
+async def git_head(cwd: str) -> Optional[str]:
+    """
+    Get the git HEAD commit of a working directory (None if not a git repo).
+
+    Results are cached per directory (up to GIT_HEAD_CACHE_SIZE of them, least
+    recently used evicted first) for GIT_HEAD_TTL seconds so hot query
+    paths don't spawn `git` on every call.
+    """
+    cached = _git_heads.get(cwd, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    head: Optional[str] = None
+    try:
+        process = await asyncio.create_subprocess_exec(
+            'git', '-C', cwd, 'rev-parse', 'HEAD',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+        if process.returncode == 0:
+            head = stdout.decode().strip() or None
+    except OSError:
+        # git not installed or cwd missing - treat as "no revision"
+        head = None
+
+    _git_heads.set(cwd, head)
+    return head
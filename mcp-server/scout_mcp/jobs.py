@@ -0,0 +1,80 @@
+"""
+Background job registry for long-running tool calls.
+
+MCP has no callback for results that arrive after the request times out, so
+a Scout query that outlives the client's request timeout is retried - and the
+work repeated - from scratch. Long queries instead run as background tasks:
+the start call returns a job id immediately and the client polls for the result.
+"""
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, Optional
+
+
+@dataclass
+class Job:
+    """A background task plus bookkeeping for polling."""
+    task: asyncio.Task
+    description: str
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+
+class JobRegistry:
+    """
+    Tracks background jobs by id.
+
+    Finished jobs are kept for RESULT_TTL seconds so clients can poll (and
+    re-poll) the result, then pruned on the next start().
+    """
+
+    # How long a finished job's result stays available
+    RESULT_TTL = 600
+    # Upper bound on jobs kept (running + finished)
+    MAX_JOBS = 256
+
+    def __init__(self):
+        # Maps: job id -> Job
+        self._jobs: Dict[str, Job] = {}
+
+    def start(self, coro: Awaitable[Any], description: str = "") -> str:
+        """Run a coroutine as a background job and return its id."""
+        self._prune()
+        if len(self._jobs) >= self.MAX_JOBS:
+            coro.close()
+            raise RuntimeError(f"Too many background jobs (limit {self.MAX_JOBS})")
+
+        job_id = uuid.uuid4().hex
+        task = asyncio.ensure_future(coro)
+        job = Job(task=task, description=description)
+        task.add_done_callback(lambda _: setattr(job, "finished_at", time.monotonic()))
+        self._jobs[job_id] = job
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id (None if unknown or expired)."""
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a running job. Returns False if the job is unknown or already done."""
+        job = self._jobs.get(job_id)
+        if job is None or job.task.done():
+            return False
+        return job.task.cancel()
+
+    def _prune(self) -> None:
+        """Drop finished jobs whose results have expired."""
+        cutoff = time.monotonic() - self.RESULT_TTL
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# Global job registry
+job_registry = JobRegistry()
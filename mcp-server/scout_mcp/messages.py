@@ -0,0 +1,50 @@
+"""
+Response texts shared by the Scout tools.
+
+Kept outside scout_mcp.tools so tool modules never import each other's
+internals - tool discovery re-executes each tool module on its own.
+
+OPTIMIZATION: Error responses are prebuilt at import - only the variable parts
+are interpolated per failure, which matters during bridge outages when every
+call fails.
+"""
+
+BRIDGE_NOT_FOUND_TEXT = (
+    "Error: Scout bridge failed to start. "
+    "Make sure Scout is installed: npm install -g swarm-scout"
+)
+TROUBLESHOOT_HELP = (
+    "**Troubleshooting:**\n"
+    "- Ensure swarm-scout is installed: `npm install -g swarm-scout`\n"
+    "- Check that Node.js is available in PATH\n"
+    "- Verify Scout configuration is valid"
+)
+QUERY_FAILED_TMPL = (
+    "❌ **Scout Query Failed**\n\n"
+    "**Query:** {query}\n"
+    "**Error:** {error}\n\n"
+) + TROUBLESHOOT_HELP
+PROCESS_FAILED_TMPL = (
+    "❌ **Scout Query Failed**\n\n"
+    "**Query:** {query}\n"
+    "**Error:** {error}\n\n"
+    "**Full Verbose Output:**\n"
+    "```\n{error_output}\n```\n\n"
+) + TROUBLESHOOT_HELP
+CLI_NOT_FOUND_TEXT = (
+    "Error: scout command not found. "
+    "Make sure Scout is installed: npm install -g swarm-scout"
+)
+TIMEOUT_TMPL = (
+    "Scout query timed out after {timeout}s. "
+    "The query may be too complex or the codebase too large. "
+    "Try:\n"
+    "- Breaking it into smaller queries\n"
+    "- Increasing the timeout parameter\n"
+    "- Using more specific search terms"
+)
+AGENT_FAILED_TMPL = (
+    "❌ **Agent '{agent}' Failed**\n\n"
+    "**Prompt:** {prompt}\n"
+    "**Error:** {error}\n\n"
+) + TROUBLESHOOT_HELP + "\n- Verify agent exists: `scout agent list`"
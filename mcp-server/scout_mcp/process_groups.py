@@ -0,0 +1,45 @@
+"""
+Process groups of Scout CLI queries that are still running.
+
+The subprocess fallback starts each `scout query` in its own session, so its
+cleanup reaches the Node.js children - which also puts them out of reach of
+a terminal's Ctrl-C. The server kills whatever is left here when a signal
+ends it, instead of leaving orphaned queries running (and spending tokens).
+
+Kept outside scout_mcp.tools so a hot-reloaded tool module shares the set.
+"""
+
+import asyncio
+import os
+import signal
+from typing import Set
+
+# Process group ids (the group leader's pid) of running Scout CLI queries
+_live_groups: Set[int] = set()
+
+
+def add(pgid: int) -> None:
+    """Track a process group started for a query."""
+    _live_groups.add(pgid)
+
+
+def discard(pgid: int) -> None:
+    """Stop tracking a process group whose query has finished or been cleaned up."""
+    _live_groups.discard(pgid)
+
+
+async def kill_all(grace: float = 2.0) -> None:
+    """SIGTERM every tracked process group, then SIGKILL them after grace seconds."""
+    if not _live_groups:
+        return
+
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        for pgid in list(_live_groups):
+            try:
+                os.killpg(pgid, sig)
+            except ProcessLookupError:
+                # Group already gone
+                _live_groups.discard(pgid)
+        if sig == signal.SIGTERM and _live_groups:
+            await asyncio.sleep(grace)
+    _live_groups.clear()
@@ -28,15 +28,19 @@ ARCHITECTURE:
 PERFORMANCE GAIN: ~100x faster query/agent invocations (10-50ms vs 1-3s overhead)
 """
 
+import argparse
 import asyncio
+import functools
+import os
 import sys
-import signal
-from mcp.server.models import InitializationOptions
+import time
+from pathlib import Path
 from mcp.server import NotificationOptions, Server
 from mcp.types import Tool, TextContent
 from .tool_discovery import tool_discovery
-from .tools.agent_tools import agent_tool_generator
+from .tool_registry import CombinedToolRegistry
 from .bridge import get_bridge, shutdown_bridge
+from . import process_groups
 
 
 app = Server("scout-mcp-server")
@@ -56,41 +60,95 @@ DEPRECATION_NOTICE = """
 ║  💡 All functionality remains the same!                    ║
 ╚════════════════════════════════════════════════════════════╝
 """
+DEPRECATION_NOTICE_BYTES = DEPRECATION_NOTICE.encode("utf-8") + b"\n"
 
-# Discover tools on startup
-discovered_tools = tool_discovery.discover_tools()
+# OPTIMIZATION: Tools are discovered lazily by the first list_tools/call_tool
+# request rather than at import, and re-discovery runs at most once per short
+# TTL so clients that re-list constantly don't pay for a scan every time.
+TOOL_CACHE_TTL = float(os.getenv("SCOUT_MCP_TOOL_CACHE_TTL", "60"))
 
+# Monotonic timestamp of the last discovery (None = never / invalidated)
+_discovered_at: float | None = None
+_discovery_lock = asyncio.Lock()
 
-@app.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available tools including agents."""
-    # Refresh tool discovery in case new tools were added
-    current_tools = tool_discovery.discover_tools()
 
-    # Add agent tools
-    agent_tools = await agent_tool_generator.discover_agent_tools()
+def invalidate_tool_cache() -> None:
+    """Force the next list_tools/call_tool request to re-discover."""
+    global _discovered_at
+    _discovered_at = None
+
+
+tool_discovery.on_invalidate(invalidate_tool_cache)
+
+
+@functools.cache
+def _get_agent_gen():
+    """
+    Import the agent tool generator on first use.
+
+    OPTIMIZATION: Keeps agent tooling off the import path, so stdio_server()
+    starts accepting the MCP handshake sooner.
+    """
+    from .tools.agent_tools import agent_tool_generator
+
+    agent_tool_generator.on_invalidate(invalidate_tool_cache)
+    return agent_tool_generator
+
+
+# Merged tool list + call_tool dispatch table, rebuilt only when a source changes
+tool_registry = CombinedToolRegistry(tool_discovery, _get_agent_gen)
+
+
+def _discovery_fresh() -> bool:
+    discovered_at = _discovered_at
+    return discovered_at is not None and time.monotonic() - discovered_at < TOOL_CACHE_TTL
+
 
-    # Combine all tools
-    all_tools = {**current_tools, **agent_tools}
+async def _refresh_tools() -> list[Tool]:
+    """
+    Return the Tool list, re-running discovery if the TTL has expired.
+
+    The list and the call_tool dispatch table come from the same registry
+    snapshot, so a call_tool lookup never triggers a separate scan.
+    """
+    global _discovered_at
+
+    if not _discovery_fresh():
+        async with _discovery_lock:
+            # Another request may have refreshed while we waited
+            if not _discovery_fresh():
+                # Refresh tool discovery in case new tools were added, and list agents
+                # OPTIMIZATION: The file scan (off the event loop, so it can't stall
+                # agent invocations) and the bridge round-trip are independent - run
+                # them concurrently.
+                await asyncio.gather(
+                    tool_discovery.discover_tools_async(),
+                    _get_agent_gen().discover_agent_tools_async(),
+                )
+                _discovered_at = time.monotonic()
 
-    return [tool.to_tool() for tool in all_tools.values()]
+    return tool_registry.snapshot()
+
+
+@app.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available tools including agents."""
+    return await _refresh_tools()
 
 
 @app.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls including agent invocations."""
-    # Check regular tools first
-    tool = tool_discovery.get_tool(name)
-    if tool:
-        return await tool.execute(arguments)
+    tool = tool_registry.get_tool(name) if _discovered_at is not None else None
+    if tool is None:
+        # Discovery is cold (call_tool before list_tools) or was invalidated
+        await _refresh_tools()
+        tool = tool_registry.get_tool(name)
 
-    # Check agent tools
-    agent_tools = await agent_tool_generator.discover_agent_tools()
-    agent_tool = agent_tools.get(name)
-    if agent_tool:
-        return await agent_tool.execute(arguments)
+    if not tool:
+        raise ValueError(f"Unknown tool: {name}")
 
-    raise ValueError(f"Unknown tool: {name}")
+    return await tool.execute(arguments)
 
 
 async def main():
@@ -101,15 +159,24 @@ async def main():
     The bridge process lives for the entire server lifetime, eliminating
     per-query process spawning overhead.
     """
+    # OPTIMIZATION: Imported here rather than at module top - importers of this
+    # module (tests, mcp_server.py) only need the handlers, not the stdio transport
+    import signal
+    from mcp.server.models import InitializationOptions
     from mcp.server.stdio import stdio_server
 
     # Print deprecation notice to stderr so it doesn't interfere with MCP protocol on stdout
-    print(DEPRECATION_NOTICE, file=sys.stderr)
+    sys.stderr.flush()
+    sys.stderr.buffer.write(DEPRECATION_NOTICE_BYTES)
+    sys.stderr.buffer.flush()
 
     # Initialize the persistent Scout bridge
+    # Pre-warmed here (spawn + health-check ping) so the first MCP request
+    # doesn't pay the Node.js startup cost
     print("[Scout MCP] Starting persistent Scout bridge...", file=sys.stderr)
     try:
         bridge = await get_bridge()
+        await bridge.warmup()
         print("[Scout MCP] Bridge started successfully - ready for high-performance queries", file=sys.stderr)
     except Exception as e:
         print(f"[Scout MCP] Warning: Failed to start bridge: {e}", file=sys.stderr)
@@ -123,17 +190,42 @@ async def main():
         print("[Scout MCP] Bridge shutdown complete", file=sys.stderr)
 
     # Register shutdown on signals
-    def signal_handler(sig):
-        print(f"[Scout MCP] Received signal {sig}, initiating shutdown...", file=sys.stderr)
-        asyncio.create_task(shutdown_handler())
+    # loop.add_signal_handler runs the callback inside the event loop (not
+    # between arbitrary bytecodes of an in-progress await), so scheduling the
+    # shutdown task from it is safe and the bridge is always reaped.
+    # app.run can't be unwound by cancellation here: its stdin reader sits in a
+    # worker thread blocked on read() until the client writes or closes stdin.
+    # So the signal reaps the bridge, the watcher and any Scout CLI queries
+    # (in their own sessions, so nothing else would stop them), then ends the
+    # process itself.
+    loop = asyncio.get_running_loop()
+    shutdown_tasks: set[asyncio.Task] = set()
 
-    try:
-        # Use signal handlers if available (not available in all contexts)
-        signal.signal(signal.SIGTERM, lambda s, f: signal_handler(s))
-        signal.signal(signal.SIGINT, lambda s, f: signal_handler(s))
-    except (ValueError, AttributeError):
-        # Signals not available in this context (e.g., Windows or threaded context)
-        pass
+    async def exit_on_signal():
+        try:
+            await asyncio.gather(shutdown_handler(), process_groups.kill_all())
+            tool_discovery.stop_watching()
+        finally:
+            sys.stderr.flush()
+            os._exit(0)
+
+    def signal_handler(sig: signal.Signals):
+        print(f"[Scout MCP] Received signal {sig.name}, initiating shutdown...", file=sys.stderr)
+        if shutdown_tasks:
+            # Already shutting down (e.g. SIGINT right after SIGTERM)
+            return
+        task = loop.create_task(exit_on_signal())
+        # Keep a strong reference until the process exits
+        shutdown_tasks.add(task)
+
+    handled_signals = []
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, signal_handler, sig)
+            handled_signals.append(sig)
+        except NotImplementedError:
+            # Windows event loops don't support signal handlers
+            break
 
     try:
         async with stdio_server() as (read_stream, write_stream):
@@ -150,12 +242,46 @@ async def main():
                 ),
             )
     finally:
+        for sig in handled_signals:
+            loop.remove_signal_handler(sig)
+        tool_discovery.stop_watching()
         # Ensure bridge is shut down on exit
         await shutdown_handler()
 
 
 def cli():
     """CLI entry point for the MCP server."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--project-dir",
+        dest="project_dir",
+        help="Default project directory for scout tools (used when a call gives no cwd)",
+    )
+    parsed_args, remaining_argv = parser.parse_known_args()
+
+    if parsed_args.project_dir:
+        project_dir = Path(parsed_args.project_dir).expanduser().resolve()
+        if project_dir.exists():
+            # Read by the tools when they are instantiated on first discovery
+            os.environ["SCOUT_DEFAULT_PROJECT_DIR"] = str(project_dir)
+            print(f"[Scout MCP] Using default project dir: {project_dir}", file=sys.stderr)
+        else:
+            print(f"[Scout MCP] Provided project dir does not exist: {project_dir}", file=sys.stderr)
+
+    # Restore remaining argv in case other systems inspect it later
+    sys.argv = [sys.argv[0], *remaining_argv]
+
+    # OPTIMIZATION: Run on uvloop (libuv) when installed - cheaper pipe I/O for
+    # the bridge connection and Scout CLI subprocesses. Not available on Windows.
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(main())
+            return
+
     asyncio.run(main())
 
 
@@ -3,7 +3,8 @@
 PERFORMANCE OPTIMIZATION (v1.1.1):
 Implements intelligent caching with file modification time (mtime) tracking to avoid
 repeated file system scans and module imports. Tools are only re-imported when their
-source files are actually modified.
+source files are actually modified - a changed signature with identical contents (by
+BLAKE2b digest) keeps the loaded module.
 
 PERFORMANCE GAIN:
 - First call: ~50-100ms (file scan + imports)
@@ -11,15 +12,115 @@ PERFORMANCE GAIN:
 - 10-100x speedup for repeated tool listing operations
 """
 
+import asyncio
+import hashlib
 import os
 import sys
-import importlib
+import importlib.util
 import inspect
+import marshal
+import threading
 import time
-from typing import List, Dict, Optional
+from types import CodeType, MappingProxyType, ModuleType
+from typing import Callable, List, Dict, Mapping, Optional
 from pathlib import Path
+from mcp.types import Tool
 from .tools.base_tool import BaseTool
 
+# Optional: kernel file-change notifications (inotify/FSEvents/kqueue)
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+
+# Identity of a file's current contents: (mtime_ns, ctime_ns, size, inode).
+# Integer fields compare exactly, and ctime/size/inode catch rewrites that
+# preserve or backdate mtime (touch -t, atomic replace with copied mtime).
+FileSignature = tuple[int, int, int, int]
+
+# Files in the tools directory that never define discoverable tools:
+# base_tool is the base class, agent_tools builds its tools per agent
+_NON_TOOL_FILES = frozenset({"base_tool.py", "agent_tools.py"})
+
+
+def _file_signature(st: os.stat_result) -> FileSignature:
+    return (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+
+
+def _loaded_from(module: ModuleType, file_path: str) -> bool:
+    """Check whether a module was loaded from the given file."""
+    module_file = getattr(module, "__file__", None)
+    if not module_file:
+        return False
+    try:
+        return os.path.samefile(module_file, file_path)
+    except OSError:
+        return False
+
+
+def _content_digest(source: bytes) -> bytes:
+    """Fingerprint of a tool file's contents."""
+    return hashlib.blake2b(source, digest_size=16).digest()
+
+
+# PEP 552 pyc flags: hash-based, checked against the source on load
+_PYC_CHECKED_HASH = 0b11
+
+
+def _read_pyc(pyc_path: str, source_hash: bytes) -> Optional[CodeType]:
+    """Load code from a checked-hash pyc if it matches the source (None otherwise)."""
+    try:
+        with open(pyc_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if (data[:4] != importlib.util.MAGIC_NUMBER or
+            int.from_bytes(data[4:8], "little") != _PYC_CHECKED_HASH or
+            data[8:16] != source_hash):
+        return None
+    try:
+        return marshal.loads(data[16:])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_pyc(pyc_path: str, source_hash: bytes, code: CodeType) -> None:
+    """Write a checked-hash pyc atomically; best effort (e.g. read-only installs)."""
+    if sys.dont_write_bytecode:
+        return
+    data = (importlib.util.MAGIC_NUMBER +
+            _PYC_CHECKED_HASH.to_bytes(4, "little") +
+            source_hash +
+            marshal.dumps(code))
+    tmp_path = f"{pyc_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(pyc_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, pyc_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+if HAS_WATCHDOG:
+    class _DirtyFlagHandler(FileSystemEventHandler):
+        """Marks a ToolDiscovery dirty when anything in its tools directory changes."""
+
+        # Opened/closed events fire on every read (including our own loads)
+        CHANGE_EVENTS = frozenset(("created", "modified", "deleted", "moved"))
+
+        def __init__(self, discovery: "ToolDiscovery"):
+            self._discovery = discovery
+
+        def on_any_event(self, event) -> None:
+            if event.event_type in self.CHANGE_EVENTS:
+                self._discovery._dirty = True
+
 
 class ToolDiscovery:
     """
@@ -29,143 +130,434 @@ class ToolDiscovery:
     This eliminates unnecessary file system scans and module imports.
     """
 
-    def __init__(self, tools_dir: str = "tools"):
+    def __init__(self, tools_dir: str = "tools", watch: bool = False):
+        """
+        Args:
+            tools_dir: Tools directory (relative paths resolve against this package)
+            watch: Watch the directory with watchdog (if installed) so cached calls
+                   skip stat'ing files entirely until something changes
+        """
         # Make tools_dir absolute relative to this file's location
         if not Path(tools_dir).is_absolute():
             tools_dir = Path(__file__).parent / tools_dir
-        self.tools_dir = Path(tools_dir)
+        self.tools_dir = Path(tools_dir).resolve()
 
         # Tool cache
+        # OPTIMIZATION: Copy-on-write - a rebuild fills a new dict and publishes it
+        # with a single rebind, so cache hits read it without taking a lock and
+        # never see a half-built tool set. Callers get a read-only view.
         self._tools: Dict[str, BaseTool] = {}
+        self._tools_view: Mapping[str, BaseTool] = MappingProxyType(self._tools)
+        # Held only while rescanning/rebuilding, never on the cached paths
+        self._rebuild_lock = threading.Lock()
+
+        # Reverse index for removing a module's tools without scanning _tools
+        # Maps: module_name -> [tool names registered from it]
+        self._tools_by_module: Dict[str, List[str]] = {}
+
+        # Prebuilt MCP Tool objects, paired with the _tools dict they were built from
+        self._tool_list_cache: Optional[tuple[Dict[str, BaseTool], List[Tool]]] = None
+        # Bumped whenever _tools changes, so derived views know when to rebuild
+        self.version = 0
 
         # File modification time cache for intelligent invalidation
-        # Maps: file_path -> (mtime, module_name)
-        self._file_mtimes: Dict[Path, tuple[float, str]] = {}
+        # Maps: file path (str, as returned by os.scandir) -> (FileSignature, module_name, content digest)
+        self._file_mtimes: Dict[str, tuple[FileSignature, str, bytes]] = {}
+
+        # Content digests, recomputed only when a file's signature changes
+        # Maps: file path -> (FileSignature, content digest)
+        self._digests: Dict[str, tuple[FileSignature, bytes]] = {}
+
+        # Compiled tool modules, reused while the source file is unchanged
+        # Maps: file path -> (FileSignature, code object)
+        self._code_cache: Dict[str, tuple[FileSignature, CodeType]] = {}
+
+        # Module in sys.modules for each tool file and the signature it was
+        # loaded at. While the file is unchanged that module is reused, so
+        # everything importing it shares one set of classes and module state.
+        # Maps: file path -> (FileSignature, module)
+        self._loaded_modules: Dict[str, tuple[FileSignature, ModuleType]] = {}
+
+        # Directory listing seen by the last full scan
+        # POSIX bumps a directory's mtime whenever entries are added, removed or
+        # renamed, so while it is unchanged only the known files need a stat.
+        self._dir_mtime: Optional[int] = None
+        # Maps: file path -> FileSignature (every candidate file, including ones that failed to load)
+        self._scanned_files: Dict[str, FileSignature] = {}
 
         # Cache statistics
         self._cache_hits = 0
         self._cache_misses = 0
         self._last_scan_time: Optional[float] = None
-    
-    def discover_tools(self, force_reload: bool = False) -> Dict[str, BaseTool]:
+
+        # Serializes discover_tools_async scans
+        self._scan_lock = asyncio.Lock()
+        # In-flight discover_tools_async scan shared by concurrent callers
+        self._scan_inflight: Optional[asyncio.Future] = None
+
+        # Callbacks notified when the tool set is explicitly invalidated
+        self._invalidation_callbacks: List[Callable[[], None]] = []
+
+        # Directory watcher, started with the first scan when watch=True.
+        # While it runs, _dirty is the only change check on the cached path.
+        self._watch = watch and HAS_WATCHDOG
+        self._observer = None
+        self._dirty = True
+
+    def discover_tools(self, force_reload: bool = False) -> Mapping[str, BaseTool]:
         """
         Discover all tools in the tools directory with intelligent caching.
 
         OPTIMIZATION: Only re-imports modules when their files have been modified.
-        This is detected by comparing file modification times (mtime).
+        This is detected by comparing file signatures (mtime, ctime, size, inode).
 
         Args:
             force_reload: If True, forces a full reload ignoring cache
 
         Returns:
-            Dictionary of tool name -> tool instance
+            Read-only mapping of tool name -> tool instance. It is a snapshot:
+            later rescans publish a new mapping instead of changing this one.
 
         Performance:
             - First call: ~50-100ms (full scan + imports)
             - Cached calls: ~1-5ms (mtime check only)
             - 10-100x speedup for repeated calls
         """
-        if not self.tools_dir.exists():
-            return {}
-
         scan_start = time.time()
-        needs_reload = force_reload
-        modified_files = set()
-        current_files = set()
 
-        # Scan directory and check for modifications
-        for file_path in self.tools_dir.glob("*.py"):
-            if file_path.name.startswith("_") or file_path.name == "base_tool.py":
-                continue
-
-            current_files.add(file_path)
-
-            try:
-                # Get current modification time
-                current_mtime = file_path.stat().st_mtime
-
-                # Check if file is new or modified
-                if file_path not in self._file_mtimes:
-                    # New file discovered
-                    modified_files.add(file_path)
-                    needs_reload = True
-                elif self._file_mtimes[file_path][0] != current_mtime:
-                    # File has been modified
-                    modified_files.add(file_path)
-                    needs_reload = True
+        # OPTIMIZATION: With a watcher running, nothing changed since the last
+        # scan unless it flagged an event - no stat calls at all
+        if not force_reload and self._tools and self._observer is not None and not self._dirty:
+            self._cache_hits += 1
+            return self._tools_view
+
+        if self._watch and self._observer is None:
+            self._start_watcher()
+        # Cleared before scanning: events from here on mark the next call dirty
+        self._dirty = False
+
+        try:
+            dir_mtime = os.stat(self.tools_dir).st_mtime_ns
+        except OSError:
+            with self._rebuild_lock:
+                return self._drop_all_tools()
+
+        # Fast path: no entries added/removed, so just re-stat the known files
+        # (in-place edits don't touch the directory mtime)
+        if not force_reload and self._tools and dir_mtime == self._dir_mtime:
+            if self._known_files_unchanged():
+                self._cache_hits += 1
+                return self._tools_view
+
+        with self._rebuild_lock:
+            return self._rescan(force_reload, dir_mtime, scan_start)
+
+    def _rescan(self, force_reload: bool, dir_mtime: int, scan_start: float) -> Mapping[str, BaseTool]:
+        """Scan the tools directory and publish a rebuilt tool set if anything changed."""
+        needs_reload = force_reload
+        # Maps: file path -> FileSignature observed during this scan
+        modified_files: Dict[str, FileSignature] = {}
+        current_files: Dict[str, FileSignature] = {}
 
-            except OSError:
-                # File may have been deleted or is inaccessible
-                continue
+        # OPTIMIZATION: Entries still present are migrated from the previous cache
+        # as the scan sees them, so whatever is left in previous_mtimes afterwards
+        # is exactly the deleted files - no separate set difference
+        previous_mtimes = self._file_mtimes
+        file_mtimes: Dict[str, tuple[FileSignature, str, bytes]] = {}
 
-        # Check for deleted files
-        deleted_files = set(self._file_mtimes.keys()) - current_files
-        if deleted_files:
-            needs_reload = True
-            for deleted_file in deleted_files:
-                del self._file_mtimes[deleted_file]
-                # Remove tools from deleted files
-                module_name = self._file_mtimes.get(deleted_file, (None, None))[1]
-                if module_name:
-                    self._remove_tools_from_module(module_name)
+        # Scan directory and check for modifications
+        # OPTIMIZATION: A single os.scandir pass - DirEntry caches its stat result,
+        # so each candidate costs one stat instead of pathlib's glob + stat calls.
+        try:
+            with os.scandir(self.tools_dir) as entries:
+                for entry in entries:
+                    file_name = entry.name
+                    if (not file_name.endswith(".py") or
+                            file_name.startswith("_") or
+                            file_name in _NON_TOOL_FILES):
+                        continue
+
+                    # Only regular files are loaded. Symlinked tool files are skipped:
+                    # following them costs an extra stat per entry on every scan.
+                    # is_file(follow_symlinks=False) uses the readdir entry type (no
+                    # syscall) and also drops directories and other non-files before
+                    # they cost a stat and a failed load
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+
+                    try:
+                        # Get current file signature
+                        current_signature = _file_signature(entry.stat(follow_symlinks=False))
+                    except OSError:
+                        # File may have been deleted or is inaccessible
+                        continue
+
+                    file_path = entry.path
+                    current_files[file_path] = current_signature
+
+                    # Check if file is new or modified
+                    cached = previous_mtimes.pop(file_path, None)
+                    if cached is not None:
+                        # Keep the entry (even if stale) until a successful reload replaces it
+                        file_mtimes[file_path] = cached
+                    if cached is None or cached[0] != current_signature:
+                        # OPTIMIZATION: A new signature with identical contents
+                        # (touch, checkout, copy-over) keeps the loaded module -
+                        # hashing the file is far cheaper than re-executing it
+                        if cached is not None and not force_reload:
+                            try:
+                                unchanged = self._file_digest(file_path, current_signature) == cached[2]
+                            except OSError:
+                                unchanged = False
+                            if unchanged:
+                                file_mtimes[file_path] = (current_signature, cached[1], cached[2])
+                                continue
+                        modified_files[file_path] = current_signature
+                        needs_reload = True
+        except FileNotFoundError:
+            return self._drop_all_tools()
+
+        self._file_mtimes = file_mtimes
+        self._dir_mtime = dir_mtime
+        self._scanned_files = current_files
 
         # If nothing changed, return cached tools
-        if not needs_reload and self._tools:
+        # (entries not seen by the scan belong to deleted files)
+        if not needs_reload and not previous_mtimes and self._tools:
             self._cache_hits += 1
-            return self._tools
+            return self._tools_view
 
         # Cache miss - need to reload
         self._cache_misses += 1
+        # Rebuilt in a copy; readers keep using the published dict meanwhile
+        tools = dict(self._tools)
+
+        for deleted_file, (_, module_name, _) in previous_mtimes.items():
+            # Remove tools from deleted files
+            self._remove_tools_from_module(tools, module_name)
+            self._code_cache.pop(deleted_file, None)
+            self._loaded_modules.pop(deleted_file, None)
+            self._digests.pop(deleted_file, None)
 
         # Only reload modified files (or all if force_reload)
         files_to_process = modified_files if not force_reload else current_files
 
-        for file_path in files_to_process:
-            module_name = f"scout_mcp.tools.{file_path.stem}"
+        for file_path, file_signature in files_to_process.items():
+            module_name = f"scout_mcp.tools.{os.path.basename(file_path)[:-3]}"
 
             try:
                 # Remove old tools from this module before re-importing
-                self._remove_tools_from_module(module_name)
-
-                # Reload the module if it's already imported
-                if module_name in sys.modules:
-                    module = importlib.reload(sys.modules[module_name])
-                else:
-                    module = importlib.import_module(module_name)
-
-                # Find classes that inherit from BaseTool
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if (obj != BaseTool and
-                        issubclass(obj, BaseTool) and
-                        obj.__module__ == module_name):
-
-                        # Instantiate the tool
+                self._remove_tools_from_module(tools, module_name)
+
+                # Execute into a fresh module (never importlib.reload, which
+                # re-executes over the old namespace and keeps its stale state)
+                module = self._load_module(module_name, file_path, file_signature)
+
+                # Tool classes registered with @register_tool; modules that
+                # don't use the decorator fall back to scanning their classes
+                tool_classes = getattr(module, "_TOOLS", None)
+                if tool_classes is None:
+                    tool_classes = [
+                        obj for _, obj in inspect.getmembers(module, inspect.isclass)
+                        if (obj != BaseTool and
+                            issubclass(obj, BaseTool) and
+                            obj.__module__ == module_name)
+                    ]
+
+                for obj in tool_classes:
+                    # Instantiate the tool - classes that need constructor
+                    # arguments (e.g. generated agent tools) are skipped
+                    # without discarding the module's other tools
+                    try:
                         tool_instance = obj()
-                        self._tools[tool_instance.name] = tool_instance
+                    except Exception:
+                        continue
+                    tools[tool_instance.name] = tool_instance
+                    self._tools_by_module.setdefault(module_name, []).append(tool_instance.name)
 
-                # Update mtime cache
-                self._file_mtimes[file_path] = (file_path.stat().st_mtime, module_name)
+                # Update mtime cache (reuse the signature from the scan - no second stat)
+                self._file_mtimes[file_path] = (
+                    file_signature, module_name, self._file_digest(file_path, file_signature)
+                )
 
             except Exception as e:
                 # Silently skip tools that fail to load
                 # But keep old version in cache if available
                 continue
 
+        self._publish(tools)
         self._last_scan_time = time.time() - scan_start
-        return self._tools
+        return self._tools_view
 
-    def _remove_tools_from_module(self, module_name: str) -> None:
+    async def discover_tools_async(self, force_reload: bool = False) -> Mapping[str, BaseTool]:
         """
-        Remove all tools that were loaded from a specific module.
-        Used when a module is being reloaded or deleted.
+        Async variant of discover_tools() for use on the event loop.
+
+        OPTIMIZATION: The scan (stat calls, source reads, module execution) runs
+        in a worker thread so it never blocks other requests on the loop.
+        Concurrent callers share the scan already in flight instead of each
+        queueing for their own; forced reloads always run a scan of their own.
         """
-        tools_to_remove = [
-            name for name, tool in self._tools.items()
-            if tool.__class__.__module__ == module_name
-        ]
-        for name in tools_to_remove:
-            del self._tools[name]
-    
+        if force_reload:
+            return await self._scan_in_thread(force_reload)
+
+        inflight = self._scan_inflight
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._scan_in_thread(False))
+            self._scan_inflight = inflight
+
+            def _clear_inflight(future: asyncio.Future) -> None:
+                if self._scan_inflight is future:
+                    self._scan_inflight = None
+
+            inflight.add_done_callback(_clear_inflight)
+
+        # shield: one cancelled caller must not cancel the scan for the rest
+        return await asyncio.shield(inflight)
+
+    async def _scan_in_thread(self, force_reload: bool) -> Mapping[str, BaseTool]:
+        """Run discover_tools() in a worker thread, one scan at a time."""
+        async with self._scan_lock:
+            return await asyncio.to_thread(self.discover_tools, force_reload)
+
+    def _load_module(self, module_name: str, file_path: str, file_signature: FileSignature) -> ModuleType:
+        """
+        Get the module for a tool file, executing it into a new module
+        registered in sys.modules only when needed.
+
+        The module already in sys.modules is reused when this file loaded it
+        at the same signature, or - on first sight of the file - when the
+        import system loaded it from this file (e.g. server.py importing a
+        tool module), so discovery never forks a second copy of its classes.
+
+        OPTIMIZATION: The compiled code object is cached per (path, signature), so a
+        forced reload of unchanged files skips reading and parsing the source.
+        Across restarts, bytecode comes from a hash-checked pyc in __pycache__
+        (PEP 552), so a cold start only hashes each source instead of compiling it.
+        Hash-checked rather than timestamp pycs: their whole-second mtimes would
+        miss same-second edits that the signature check catches.
+        """
+        current = sys.modules.get(module_name)
+        if current is not None:
+            loaded = self._loaded_modules.get(file_path)
+            if loaded is None:
+                reuse = _loaded_from(current, file_path)
+            else:
+                reuse = loaded[0] == file_signature and loaded[1] is current
+            if reuse:
+                self._loaded_modules[file_path] = (file_signature, current)
+                return current
+
+        cached = self._code_cache.get(file_path)
+        if cached is not None and cached[0] == file_signature:
+            code = cached[1]
+        else:
+            with open(file_path, "rb") as f:
+                source = f.read()
+            pyc_path = importlib.util.cache_from_source(file_path)
+            source_hash = importlib.util.source_hash(source)
+            code = _read_pyc(pyc_path, source_hash)
+            if code is None:
+                code = compile(source, file_path, "exec", dont_inherit=True)
+                _write_pyc(pyc_path, source_hash, code)
+            self._code_cache[file_path] = (file_signature, code)
+            # Record the digest of exactly the source that was executed
+            self._digests[file_path] = (file_signature, _content_digest(source))
+
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+
+        # Register before executing (like the import system) so the module can
+        # be found by name while it initializes; restore the old one on failure
+        previous = sys.modules.get(module_name)
+        sys.modules[module_name] = module
+        try:
+            exec(code, module.__dict__)
+        except BaseException:
+            if previous is not None:
+                sys.modules[module_name] = previous
+            else:
+                sys.modules.pop(module_name, None)
+            raise
+        self._loaded_modules[file_path] = (file_signature, module)
+        return module
+
+    def _start_watcher(self) -> None:
+        """Start watching tools_dir; on failure, keep using the stat-based checks."""
+        observer = Observer()
+        try:
+            observer.schedule(_DirtyFlagHandler(self), str(self.tools_dir), recursive=False)
+            observer.start()
+        except Exception as e:
+            # e.g. missing directory or inotify watch limit reached
+            print(f"[Scout MCP] Tool directory watcher unavailable: {e}", file=sys.stderr)
+            self._watch = False
+            return
+        self._observer = observer
+
+    def stop_watching(self) -> None:
+        """Stop the directory watcher (cached calls fall back to stat checks)."""
+        observer, self._observer = self._observer, None
+        self._watch = False
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=1)
+
+    def _file_digest(self, file_path: str, file_signature: FileSignature) -> bytes:
+        """Get a file's content digest, re-reading it only if its signature changed."""
+        cached = self._digests.get(file_path)
+        if cached is not None and cached[0] == file_signature:
+            return cached[1]
+        with open(file_path, "rb") as f:
+            digest = _content_digest(f.read())
+        self._digests[file_path] = (file_signature, digest)
+        return digest
+
+    def _known_files_unchanged(self) -> bool:
+        """Check whether every file from the last full scan still has its signature."""
+        for file_path, signature in self._scanned_files.items():
+            try:
+                if _file_signature(os.lstat(file_path)) != signature:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _drop_all_tools(self) -> Mapping[str, BaseTool]:
+        """
+        Forget every tool after the tools directory disappeared (caller holds
+        _rebuild_lock). Publishes an empty snapshot, so get_tool() stops serving
+        tools whose files are gone, and the directory is fully rescanned if it
+        comes back.
+        """
+        self._file_mtimes = {}
+        self._digests.clear()
+        self._code_cache.clear()
+        self._loaded_modules.clear()
+        self._dir_mtime = None
+        self._scanned_files = {}
+        self._tools_by_module.clear()
+        if self._tools:
+            self._publish({})
+        return self._tools_view
+
+    def _remove_tools_from_module(self, tools: Dict[str, BaseTool], module_name: str) -> None:
+        """
+        Remove all tools that were loaded from a specific module from a tool set
+        being rebuilt. Used when a module is being reloaded or deleted.
+        """
+        for name in self._tools_by_module.pop(module_name, ()):
+            tool = tools.get(name)
+            # Skip names since taken over by a tool from another module
+            if tool is not None and tool.__class__.__module__ == module_name:
+                del tools[name]
+
+    def _publish(self, tools: Dict[str, BaseTool]) -> None:
+        """Make a rebuilt tool set current (a single rebind readers see atomically)."""
+        self._tools_view = MappingProxyType(tools)
+        self._tools = tools
+        self._mark_changed()
+
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """
         Get a specific tool by name.
@@ -186,12 +578,37 @@ class ToolDiscovery:
             self.discover_tools()
         return list(self._tools.values())
 
-    def reload_tools(self) -> Dict[str, BaseTool]:
+    def current_tools(self) -> Mapping[str, BaseTool]:
+        """Tools from the most recent scan (read-only), without rescanning."""
+        return self._tools_view
+
+    def _mark_changed(self) -> None:
+        """Record that _tools changed: bump version so derived views rebuild."""
+        self.version += 1
+
+    def get_tool_list(self) -> List[Tool]:
+        """
+        Get the MCP Tool definitions for all discovered tools.
+
+        OPTIMIZATION: Built once per tool set instead of re-running to_tool()
+        (and copying every input schema) on each list_tools request.
+        """
+        tools = self._tools
+        cached = self._tool_list_cache
+        # Keyed by dict identity: a list built while a rebuild was published
+        # belongs to the old dict and is never mistaken for the new one
+        if cached is None or cached[0] is not tools:
+            cached = (tools, [tool.to_tool() for tool in tools.values()])
+            self._tool_list_cache = cached
+        return cached[1]
+
+    def reload_tools(self) -> Mapping[str, BaseTool]:
         """
         Force reload all tools, ignoring cache.
 
         Useful for development when you want to pick up changes immediately.
         """
+        self._notify_invalidated()
         return self.discover_tools(force_reload=True)
 
     def invalidate_cache(self) -> None:
@@ -201,10 +618,33 @@ class ToolDiscovery:
         Next call to discover_tools() will perform a full scan and reload.
         """
         self._file_mtimes.clear()
-        self._tools.clear()
+        self._code_cache.clear()
+        self._loaded_modules.clear()
+        self._digests.clear()
+        self._dir_mtime = None
+        self._scanned_files = {}
+        self._dirty = True
+        # Later callers must not join a scan that started before the invalidation
+        self._scan_inflight = None
+        self._tools_by_module.clear()
+        self._publish({})
         self._cache_hits = 0
         self._cache_misses = 0
         self._last_scan_time = None
+        self._notify_invalidated()
+
+    def on_invalidate(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback to run whenever the tool set is invalidated.
+
+        Used by the server to drop derived caches (e.g. the list_tools response).
+        """
+        self._invalidation_callbacks.append(callback)
+
+    def _notify_invalidated(self) -> None:
+        """Run all registered invalidation callbacks."""
+        for callback in self._invalidation_callbacks:
+            callback()
 
     def get_cache_stats(self) -> Dict[str, any]:
         """
@@ -227,4 +667,4 @@ class ToolDiscovery:
 
 
 # Global tool discovery instance
-tool_discovery = ToolDiscovery()
+tool_discovery = ToolDiscovery(watch=True)
@@ -0,0 +1,71 @@
+"""Combined view of discovered tools and agent tools.
+
+PERFORMANCE OPTIMIZATION:
+list_tools and call_tool used to merge the two tool sources into a fresh dict
+and rebuild the Tool list on every refresh. The registry keeps one merged
+dispatch table and one Tool list, and rebuilds them only when either source's
+version counter has moved - otherwise both are returned by reference.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from mcp.types import Tool
+from .tool_discovery import ToolDiscovery
+from .tools.base_tool import BaseTool
+
+if TYPE_CHECKING:
+    from .tools.agent_tools import AgentToolGenerator
+
+
+class CombinedToolRegistry:
+    """Merged, lazily rebuilt snapshot of regular tools and agent tools."""
+
+    def __init__(self, tool_discovery: ToolDiscovery, get_agent_generator: Callable[[], "AgentToolGenerator"]):
+        """
+        Args:
+            tool_discovery: Source of the regular (file-based) tools
+            get_agent_generator: Returns the agent tool generator; called lazily
+                                 so agent tooling stays off the import path
+        """
+        self._tool_discovery = tool_discovery
+        self._get_agent_generator = get_agent_generator
+
+        # Source versions the snapshot below was built from
+        self._built_version: Optional[Tuple[int, int]] = None
+        # Maps: tool name -> tool instance (agent tools win name clashes)
+        self._dispatch: Dict[str, BaseTool] = {}
+        self._tool_list: List[Tool] = []
+
+    def _sources_version(self) -> Tuple[int, int]:
+        return (self._tool_discovery.version, self._get_agent_generator().version)
+
+    def _ensure_current(self) -> None:
+        """Rebuild the merged view if either source changed since the last build."""
+        version = self._sources_version()
+        if version == self._built_version:
+            return
+
+        agent_generator = self._get_agent_generator()
+        self._dispatch = {
+            **self._tool_discovery.current_tools(),
+            **agent_generator.current_agent_tools(),
+        }
+        # Prebuilt per-source Tool lists - only rebuilt when that source changed.
+        # Same precedence as _dispatch: a regular tool shadowed by an agent tool
+        # is left out, so every listed name is the tool call_tool dispatches to.
+        agent_tool_list = agent_generator.get_agent_tool_list()
+        agent_names = {tool.name for tool in agent_tool_list}
+        self._tool_list = [
+            tool for tool in self._tool_discovery.get_tool_list()
+            if tool.name not in agent_names
+        ] + agent_tool_list
+        self._built_version = version
+
+    def snapshot(self) -> List[Tool]:
+        """Get the combined Tool list (shared - callers must not mutate it)."""
+        self._ensure_current()
+        return self._tool_list
+
+    def get_tool(self, name: str) -> Optional[BaseTool]:
+        """Look up a tool instance by name."""
+        self._ensure_current()
+        return self._dispatch.get(name)
@@ -11,11 +11,20 @@ PERFORMANCE GAIN: ~100x faster for both operations
 """
 
 import asyncio
+import sys
 import time
+from functools import cached_property
+from pathlib import Path
 from .base_tool import BaseTool
 from mcp.types import TextContent, Tool
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from ..bridge import ScoutBridgeClient, ScoutBridgeError, get_bridge
+from ..bridge.client import DEFAULT_BRIDGE_SCRIPT, scout_root_for
+from ..messages import AGENT_FAILED_TMPL, BRIDGE_NOT_FOUND_TEXT
+
+# No auto-discovered tools here: AgentTools are built per agent by
+# AgentToolGenerator, so tool discovery skips this module's classes
+_TOOLS: List[type] = []
 
 
 class AgentToolGenerator:
@@ -27,6 +36,9 @@ class AgentToolGenerator:
 
     # Cache TTL in seconds (5 minutes)
     CACHE_TTL = 300
+    # Shorter TTL for an empty result (no agents, or the bridge failed), so a
+    # broken bridge isn't asked again on every list_tools request
+    EMPTY_CACHE_TTL = 30
 
     def __init__(self, bridge_client: ScoutBridgeClient = None):
         """Initialize with an optional Scout bridge client.
@@ -38,17 +50,68 @@ class AgentToolGenerator:
         self.bridge_client = bridge_client
         self._agent_cache: Optional[List[Dict[str, str]]] = None
         self._cache_timestamp: Optional[float] = None
+        self._cache_ttl: float = self.CACHE_TTL
+        # Bridge's version token for _agent_cache; lets a refresh skip an unchanged list
+        self._agent_version: Optional[str] = None
+        # In-flight bridge listing shared by concurrent callers
+        self._list_inflight: Optional[asyncio.Future] = None
+
+        # Memoized agent tools, keyed on the agent directories' mtimes
+        # Maps: (dir signature, {tool name -> AgentTool})
+        self._agent_tools_cache: Optional[tuple[tuple, Dict[str, BaseTool]]] = None
+        # Agent list the cached tools were built from
+        self._agent_tools_source: Optional[List[Dict[str, str]]] = None
+        # Bumped whenever the agent tool set is replaced or invalidated
+        self.version = 0
+        # Prebuilt MCP Tool objects, keyed on the identity of the tools dict they came from
+        # Maps: (agent tools dict, [Tool])
+        self._agent_tool_list: Optional[tuple[Dict[str, BaseTool], List[Tool]]] = None
+        self._invalidation_callbacks: List[Callable[[], None]] = []
 
     def _is_cache_valid(self) -> bool:
         """Check if the cache is still valid based on TTL."""
         if self._agent_cache is None or self._cache_timestamp is None:
             return False
-        return (time.time() - self._cache_timestamp) < self.CACHE_TTL
+        return (time.time() - self._cache_timestamp) < self._cache_ttl
 
     def invalidate_cache(self) -> None:
         """Manually invalidate the cache to force a refresh on next call."""
         self._agent_cache = None
         self._cache_timestamp = None
+        self._agent_version = None
+        self._list_inflight = None
+        self._agent_tools_cache = None
+        self._agent_tool_list = None
+        self.version += 1
+        for callback in self._invalidation_callbacks:
+            callback()
+
+    def on_invalidate(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run whenever the agent cache is invalidated."""
+        self._invalidation_callbacks.append(callback)
+
+    def _agent_dirs(self) -> List[Path]:
+        """Global and project agent directories, as resolved by the bridge."""
+        bridge_script = self.bridge_client.bridge_script_path if self.bridge_client else DEFAULT_BRIDGE_SCRIPT
+        return [
+            Path.home() / ".swarmrc" / "agents",
+            scout_root_for(bridge_script) / ".swarmrc" / "agents",
+        ]
+
+    def _agent_dirs_signature(self) -> tuple:
+        """
+        Stat the agent directories (not their contents).
+
+        Adding, removing or renaming an agent file bumps its directory's mtime,
+        which is far cheaper to check than listing agents over the bridge.
+        """
+        signature = []
+        for agents_dir in self._agent_dirs():
+            try:
+                signature.append(agents_dir.stat().st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
 
     async def _list_agents_async(self) -> List[Dict[str, str]]:
         """
@@ -56,16 +119,39 @@ class AgentToolGenerator:
 
         PERFORMANCE: ~100x faster than subprocess approach.
         Uses persistent bridge instead of spawning `scout agent list --json`.
+        Concurrent callers on a cold cache share a single bridge round-trip.
         """
         if self._is_cache_valid():
             return self._agent_cache
 
+        inflight = self._list_inflight
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_agents())
+            self._list_inflight = inflight
+
+            def _clear_inflight(future: asyncio.Future) -> None:
+                if self._list_inflight is future:
+                    self._list_inflight = None
+
+            inflight.add_done_callback(_clear_inflight)
+
+        # shield: one cancelled caller must not cancel the listing for the rest
+        return await asyncio.shield(inflight)
+
+    async def _fetch_agents(self) -> List[Dict[str, str]]:
+        """Fetch the agent list from the bridge and update the cache."""
         try:
             # Get or create the global bridge instance
             bridge = self.bridge_client or await get_bridge()
 
             # List agents via bridge (direct SDK call, no subprocess)
-            data = await bridge.list_agents()
+            # OPTIMIZATION: Send the version we hold; if the list hasn't changed
+            # the bridge answers with a tiny "unchanged" result instead of the list
+            data = await bridge.list_agents(if_none_match=self._agent_version)
+
+            if data.get("unchanged") and self._agent_cache is not None:
+                self._set_agent_cache(self._agent_cache, self._agent_version)
+                return self._agent_cache
 
             agents = []
 
@@ -76,44 +162,54 @@ class AgentToolGenerator:
                 agents.append(agent)
 
             # Update cache with timestamp
-            self._agent_cache = agents
-            self._cache_timestamp = time.time()
+            self._set_agent_cache(agents, data.get("version"))
             return agents
 
         except ScoutBridgeError as e:
-            print(f"Error listing agents via bridge: {e}")
-            return []
+            print(f"[Scout MCP] Error listing agents via bridge: {e}", file=sys.stderr)
         except Exception as e:
-            print(f"Error listing agents: {e}")
-            return []
+            print(f"[Scout MCP] Error listing agents: {e}", file=sys.stderr)
 
-    def _list_agents(self) -> List[Dict[str, str]]:
-        """
-        Synchronous wrapper for async agent listing.
-        Uses asyncio.run() to execute async bridge call.
-        """
-        # Get or create event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If loop is already running (e.g., in async context),
-                # create a task instead
-                return asyncio.create_task(self._list_agents_async())
-            else:
-                return loop.run_until_complete(self._list_agents_async())
-        except RuntimeError:
-            # No event loop, create one
-            return asyncio.run(self._list_agents_async())
+        # Negative cache: don't retry a failing bridge on every request
+        self._set_agent_cache([], None)
+        return []
+
+    def _set_agent_cache(self, agents: List[Dict[str, str]], version: Optional[str]) -> None:
+        """Store the agent list, using the short TTL when it is empty."""
+        self._agent_cache = agents
+        self._agent_version = version
+        self._cache_timestamp = time.time()
+        self._cache_ttl = self.CACHE_TTL if agents else self.EMPTY_CACHE_TTL
 
     def create_agent_tool(self, agent_id: str, agent_name: str, agent_description: str) -> 'AgentTool':
         """Create a tool for a specific agent."""
         return AgentTool(agent_id, agent_name, agent_description, self.bridge_client)
 
-    async def discover_agent_tools(self) -> Dict[str, BaseTool]:
-        """Discover all agents and create tools for them."""
-        tools = {}
+    async def discover_agent_tools_async(self) -> Dict[str, BaseTool]:
+        """
+        Discover all agents and create tools for them.
+
+        OPTIMIZATION: Memoized on the agent directories' mtimes - while they are
+        unchanged (and the agent list TTL holds) this is a single dict return.
+        """
+        signature = self._agent_dirs_signature()
+        cached = self._agent_tools_cache
+        if cached is not None and cached[0] == signature and self._is_cache_valid():
+            return cached[1]
+
+        if cached is not None and cached[0] != signature:
+            # Agents were added, removed or renamed - don't wait for the TTL
+            self._agent_cache = None
+            self._cache_timestamp = None
+            self._agent_version = None
+
         agents = await self._list_agents_async()
+        if cached is not None and agents is self._agent_tools_source:
+            # Same agent list (e.g. revalidated as unchanged) - keep the tools
+            self._agent_tools_cache = (signature, cached[1])
+            return cached[1]
 
+        tools = {}
         for agent in agents:
             agent_id = agent.get("id")
             agent_name = agent.get("name")
@@ -123,8 +219,31 @@ class AgentToolGenerator:
                 tool = self.create_agent_tool(agent_id, agent_name, agent_description)
                 tools[tool.name] = tool
 
+        self._agent_tools_cache = (signature, tools)
+        self._agent_tools_source = agents
+        self.version += 1
         return tools
 
+    def current_agent_tools(self) -> Dict[str, BaseTool]:
+        """Agent tools from the most recent discovery, without listing agents."""
+        return self._agent_tools_cache[1] if self._agent_tools_cache is not None else {}
+
+    def get_agent_tool_list(self) -> List[Tool]:
+        """
+        Get the MCP Tool definitions for the most recently discovered agents.
+
+        OPTIMIZATION: Rebuilt only when discover_agent_tools_async() produced a
+        new set of agent tools, not on every list_tools request.
+        """
+        if self._agent_tools_cache is None:
+            return []
+        tools = self._agent_tools_cache[1]
+        cached = self._agent_tool_list
+        if cached is None or cached[0] is not tools:
+            cached = (tools, [tool.to_tool() for tool in tools.values()])
+            self._agent_tool_list = cached
+        return cached[1]
+
 
 class AgentTool(BaseTool):
     """
@@ -148,11 +267,14 @@ class AgentTool(BaseTool):
         self.agent_description = agent_description
         self.bridge_client = bridge_client
 
-    @property
+    # OPTIMIZATION: Agent tools are immutable after construction, so name,
+    # description and schema are built once rather than on every to_tool()
+
+    @cached_property
     def name(self) -> str:
         return f"agent_{self.agent_id.replace('-', '_')}"
 
-    @property
+    @cached_property
     def description(self) -> str:
         return (
             f"Invoke the '{self.agent_name}' specialized agent. "
@@ -160,7 +282,7 @@ class AgentTool(BaseTool):
             f"Use this agent when you need expertise in its specific domain."
         )
 
-    @property
+    @cached_property
     def input_schema(self) -> Dict[str, Any]:
         return {
             "type": "object",
@@ -224,25 +346,11 @@ class AgentTool(BaseTool):
 
             # Check for specific error patterns
             if "not found" in error_msg.lower():
-                return [TextContent(
-                    type="text",
-                    text=(
-                        "Error: Scout bridge failed to start. "
-                        "Make sure Scout is installed: npm install -g swarm-scout"
-                    )
-                )]
+                return [TextContent(type="text", text=BRIDGE_NOT_FOUND_TEXT)]
 
             return [TextContent(
                 type="text",
-                text=(
-                    f"❌ **Agent '{self.agent_name}' Failed**\n\n"
-                    f"**Prompt:** {prompt}\n"
-                    f"**Error:** {error_msg}\n\n"
-                    f"**Troubleshooting:**\n"
-                    f"- Ensure swarm-scout is installed: `npm install -g swarm-scout`\n"
-                    f"- Check that Node.js is available in PATH\n"
-                    f"- Verify agent exists: `scout agent list`"
-                )
+                text=AGENT_FAILED_TMPL.format(agent=self.agent_name, prompt=prompt, error=error_msg)
             )]
 
         except Exception as e:
@@ -1,7 +1,8 @@
 """Base tool interface for MCP server tools."""
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Type, TypeVar
 from mcp.types import Tool, TextContent
 
 
@@ -37,4 +38,20 @@ class BaseTool(ABC):
             name=self.name,
             description=self.description,
             inputSchema=self.input_schema
-        )
\ No newline at end of file
+        )
+
+
+ToolClass = TypeVar("ToolClass", bound=Type[BaseTool])
+
+
+def register_tool(cls: ToolClass) -> ToolClass:
+    """
+    Class decorator marking a BaseTool subclass for auto-discovery.
+
+    OPTIMIZATION: Appends the class to its module's _TOOLS list, so discovery
+    reads that list directly instead of walking every module attribute with
+    inspect.getmembers(). Modules without _TOOLS are still scanned the old way.
+    """
+    module = sys.modules[cls.__module__]
+    module.__dict__.setdefault("_TOOLS", []).append(cls)
+    return cls
@@ -8,22 +8,69 @@ OLD APPROACH: Python -> subprocess spawn -> Node.js -> Scout CLI -> Scout SDK
 NEW APPROACH: Python -> JSON-RPC -> Persistent Node.js Bridge -> Scout SDK
 
 PERFORMANCE GAIN: ~100x faster (10-50ms vs 1-3s overhead)
+
+FALLBACK: Set SCOUT_MCP_QUERY_SUBPROCESS=1 to run queries through the Scout CLI
+(`scout query`, or $SCOUT_BIN) instead - e.g. when the bridge cannot load the SDK.
 """
 
 import asyncio
-from .base_tool import BaseTool
+import os
+import signal
+import sys
+from pathlib import Path
+from .base_tool import BaseTool, register_tool
 from mcp.types import TextContent
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from ..bridge import ScoutBridgeClient, ScoutBridgeError, get_bridge
+from ..cache import SemanticCache, TTLCache, git_head
+from .. import process_groups
+from ..messages import (
+    BRIDGE_NOT_FOUND_TEXT,
+    CLI_NOT_FOUND_TEXT,
+    PROCESS_FAILED_TMPL,
+    QUERY_FAILED_TMPL,
+    TIMEOUT_TMPL,
+)
+
+# Read size when draining the Scout CLI's output pipes
+_PIPE_READ_SIZE = 64 * 1024
+# Seconds a timed-out Scout CLI gets to exit after SIGTERM before SIGKILL
+_TERMINATE_GRACE = 2.0
+# Trailing bytes of the CLI's stderr included in a failure response
+_MAX_ERROR_OUTPUT = 4000
+
+
+class ScoutProcessError(Exception):
+    """A `scout query` subprocess exited with a non-zero status."""
+
+    def __init__(self, last_error: str, error_output: str):
+        """error_output is the tail of the CLI's stderr (_MAX_ERROR_OUTPUT bytes)."""
+        super().__init__(last_error)
+        self.last_error = last_error
+        self.error_output = error_output
 
 
+@register_tool
 class CeregrepQueryTool(BaseTool):
     """
     Tool to query Scout agent for codebase context and analysis.
 
     OPTIMIZED: Uses persistent bridge process for ~100x faster queries.
+    Successful non-verbose responses are cached per (query, cwd, model, git HEAD),
+    whichever transport produced them. With SCOUT_SEMANTIC_CACHE=1, a query
+    that paraphrases a cached one (same cwd, model and HEAD) is served from
+    that query's response.
     """
 
+    # Response cache bounds (0 disables the cache)
+    RESPONSE_CACHE_SIZE = int(os.getenv("SCOUT_MCP_RESPONSE_CACHE_SIZE", "128"))
+    RESPONSE_CACHE_TTL = float(os.getenv("SCOUT_MCP_RESPONSE_CACHE_TTL", "300"))
+    # Semantic (paraphrase) matching on top of the response cache - off by
+    # default, loading the embedding model takes seconds
+    SEMANTIC_CACHE = os.getenv("SCOUT_SEMANTIC_CACHE", "") == "1"
+    SEMANTIC_CACHE_MODEL = os.getenv("SCOUT_SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2")
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SCOUT_SEMANTIC_CACHE_THRESHOLD", "0.95"))
+
     def __init__(self, bridge_client: ScoutBridgeClient = None):
         """Initialize the tool with a Scout bridge client.
 
@@ -33,6 +80,40 @@ class CeregrepQueryTool(BaseTool):
         """
         self.bridge_client = bridge_client
 
+        # Maps: (query, cwd, model, git HEAD) -> formatted response
+        self._response_cache = TTLCache(self.RESPONSE_CACHE_SIZE, self.RESPONSE_CACHE_TTL)
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._semantic_hits = 0
+
+        self._semantic_cache: Optional[SemanticCache] = None
+        if self.SEMANTIC_CACHE and self.RESPONSE_CACHE_TTL > 0:
+            try:
+                self._semantic_cache = SemanticCache(
+                    self.SEMANTIC_CACHE_MODEL,
+                    self.SEMANTIC_CACHE_THRESHOLD,
+                    self.RESPONSE_CACHE_SIZE,
+                )
+            except ImportError as e:
+                print(f"[Scout MCP] Semantic cache disabled: {e}", file=sys.stderr)
+
+        # Subprocess fallback: spawn the Scout CLI per query instead of using the bridge
+        self.use_subprocess = os.environ.get("SCOUT_MCP_QUERY_SUBPROCESS", "") == "1"
+        self.scout_bin = os.environ.get("SCOUT_BIN", "scout")
+
+        # Default project directory (set by `scout-mcp --project-dir`)
+        default_dir = os.environ.get("SCOUT_DEFAULT_PROJECT_DIR")
+        self.default_cwd: Optional[Path] = None
+
+        if default_dir:
+            try:
+                resolved = Path(default_dir).expanduser().resolve()
+                if resolved.exists():
+                    self.default_cwd = resolved
+            except Exception:
+                # Ignore invalid defaults; fall back to runtime cwd handling.
+                self.default_cwd = None
+
     @property
     def name(self) -> str:
         return "scout_query"
@@ -44,7 +125,8 @@ class CeregrepQueryTool(BaseTool):
             "Scout uses LLM-powered analysis with bash and grep tools to explore code, "
             "find patterns, analyze architecture, and provide detailed context. "
             "Use this when you need to understand code structure, find implementations, "
-            "or gather context from files."
+            "or gather context from files. For long-running queries that may exceed "
+            "your client's request timeout, use scout_query_start and scout_query_poll."
         )
 
     @property
@@ -76,6 +158,28 @@ class CeregrepQueryTool(BaseTool):
             "required": ["query"]
         }
 
+    def _resolve_cwd(self, cwd_arg: Optional[str]) -> Path:
+        """Resolve the working directory argument against the default project dir."""
+        if cwd_arg:
+            effective_cwd = Path(str(cwd_arg)).expanduser()
+            if not effective_cwd.is_absolute():
+                base = self.default_cwd or Path.cwd()
+                effective_cwd = base / effective_cwd
+            return effective_cwd.resolve()
+        return self.default_cwd or Path.cwd()
+
+    def _validate(self, query: str, effective_cwd: Path) -> Optional[List[TextContent]]:
+        """Return an error response for invalid arguments, or None if they are valid."""
+        if not query:
+            return [TextContent(type="text", text="Error: query parameter is required")]
+
+        if not effective_cwd.exists():
+            return [TextContent(
+                type="text",
+                text=f"Error: working directory does not exist: {effective_cwd}"
+            )]
+        return None
+
     async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """
         Execute Scout query using persistent bridge.
@@ -84,43 +188,89 @@ class CeregrepQueryTool(BaseTool):
         The bridge keeps Scout SDK loaded in memory and eliminates process spawn overhead.
         """
         query = arguments.get("query", "")
-        cwd = arguments.get("cwd", ".")
-        model = arguments.get("model")
-        verbose = arguments.get("verbose", False)
-        timeout = arguments.get("timeout", 300)  # Default 5 minutes for complex queries
+        effective_cwd = self._resolve_cwd(arguments.get("cwd"))
 
-        if not query:
-            return [TextContent(type="text", text="Error: query parameter is required")]
+        error = self._validate(query, effective_cwd)
+        if error:
+            return error
+
+        return await self._run_query(
+            query=query,
+            cwd=effective_cwd,
+            model=arguments.get("model"),
+            verbose=arguments.get("verbose", False),
+            timeout=arguments.get("timeout", 300)  # Default 5 minutes for complex queries
+        )
+
+    async def _run_query(
+        self,
+        query: str,
+        cwd: Path,
+        model: Optional[str],
+        verbose: bool,
+        timeout: int
+    ) -> List[TextContent]:
+        """Run a validated query over the bridge and format the response."""
+        cache_key = None
+        embedding = None
+        if not verbose and self.RESPONSE_CACHE_TTL > 0:
+            cache_key = (query, str(cwd), model, await git_head(str(cwd)))
+            cached = self._response_cache.get(cache_key)
+            if cached is None and self._semantic_cache is not None:
+                embedding = await self._embed(query)
+                if embedding is not None:
+                    # Scope: (cwd, model, git HEAD) - only paraphrases of the same question
+                    similar_key = self._semantic_cache.match(cache_key[1:], embedding)
+                    if similar_key is not None:
+                        cached = self._response_cache.get(similar_key)
+                        if cached is not None:
+                            self._semantic_hits += 1
+            if cached is not None:
+                self._cache_hits += 1
+                return list(cached)
+            self._cache_misses += 1
 
         try:
-            # Get or create the global bridge instance
-            # OPTIMIZATION: Reuses persistent Node.js process instead of spawning new one
-            bridge = self.bridge_client or await get_bridge()
-
-            # Execute query via bridge (direct SDK call, no subprocess)
-            output = await bridge.query(
-                query=query,
-                cwd=cwd,
-                model=model,
-                verbose=verbose,
-                timeout=timeout
-            )
+            if self.use_subprocess:
+                output = await self._query_subprocess(query, cwd, model, verbose, timeout)
+            else:
+                # Get or create the global bridge instance
+                # OPTIMIZATION: Reuses persistent Node.js process instead of spawning new one
+                bridge = self.bridge_client or await get_bridge()
 
-            return [TextContent(
+                # Execute query via bridge (direct SDK call, no subprocess)
+                output = await bridge.query(
+                    query=query,
+                    cwd=str(cwd),
+                    model=model,
+                    verbose=verbose,
+                    timeout=timeout
+                )
+
+            response = [TextContent(
                 type="text",
                 text=f"## Scout Query Result\n\n**Query:** {query}\n\n{output}"
             )]
+            if cache_key is not None:
+                self._response_cache.set(cache_key, response)
+                if embedding is not None and self._semantic_cache is not None:
+                    self._semantic_cache.add(cache_key[1:], embedding, cache_key)
+            return list(response)
 
         except asyncio.TimeoutError:
+            return [TextContent(type="text", text=TIMEOUT_TMPL.format(timeout=timeout))]
+
+        except FileNotFoundError:
+            # Subprocess fallback: the Scout CLI isn't on PATH
+            return [TextContent(type="text", text=CLI_NOT_FOUND_TEXT)]
+
+        except ScoutProcessError as e:
             return [TextContent(
                 type="text",
-                text=(
-                    f"Scout query timed out after {timeout}s. "
-                    f"The query may be too complex or the codebase too large. "
-                    f"Try:\n"
-                    f"- Breaking it into smaller queries\n"
-                    f"- Increasing the timeout parameter\n"
-                    f"- Using more specific search terms"
+                text=PROCESS_FAILED_TMPL.format(
+                    query=query,
+                    error=e.last_error,
+                    error_output=e.error_output
                 )
             )]
 
@@ -129,25 +279,11 @@ class CeregrepQueryTool(BaseTool):
 
             # Check for specific error patterns
             if "not found" in error_msg.lower():
-                return [TextContent(
-                    type="text",
-                    text=(
-                        "Error: Scout bridge failed to start. "
-                        "Make sure Scout is installed: npm install -g swarm-scout"
-                    )
-                )]
+                return [TextContent(type="text", text=BRIDGE_NOT_FOUND_TEXT)]
 
             return [TextContent(
                 type="text",
-                text=(
-                    f"❌ **Scout Query Failed**\n\n"
-                    f"**Query:** {query}\n"
-                    f"**Error:** {error_msg}\n\n"
-                    f"**Troubleshooting:**\n"
-                    f"- Ensure swarm-scout is installed: `npm install -g swarm-scout`\n"
-                    f"- Check that Node.js is available in PATH\n"
-                    f"- Verify Scout configuration is valid"
-                )
+                text=QUERY_FAILED_TMPL.format(query=query, error=error_msg)
             )]
 
         except Exception as e:
@@ -155,3 +291,182 @@ class CeregrepQueryTool(BaseTool):
                 type="text",
                 text=f"Error executing Scout: {str(e)}"
             )]
+
+    async def _embed(self, query: str):
+        """Embed a query for the semantic cache (None, and the cache disabled, on failure)."""
+        try:
+            return await self._semantic_cache.embed(query)
+        except Exception as e:
+            # Missing sentence-transformers or the model failed to load
+            print(f"[Scout MCP] Semantic cache disabled: {e}", file=sys.stderr)
+            self._semantic_cache = None
+            return None
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached query responses."""
+        self._response_cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._semantic_hits = 0
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache statistics.
+
+        Returns:
+            Dictionary with cache hits (of which semantic), misses, hit rate, and cached entries
+        """
+        total_requests = self._cache_hits + self._cache_misses
+        hit_rate = (self._cache_hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            'cache_hits': self._cache_hits,
+            'semantic_hits': self._semantic_hits,
+            'cache_misses': self._cache_misses,
+            'hit_rate_percent': round(hit_rate, 2),
+            'cached_responses': len(self._response_cache),
+        }
+
+    async def _query_subprocess(
+        self,
+        query: str,
+        cwd: Path,
+        model: Optional[str],
+        verbose: bool,
+        timeout: int
+    ) -> str:
+        """
+        Run a query through the Scout CLI (fallback when the bridge is disabled).
+
+        Pays the full Node.js startup per query - use only when the bridge can't run.
+
+        OPTIMIZATION: stdout/stderr are drained incrementally into buffers as the
+        CLI writes them (no communicate() double-buffering), and `timeout` is an
+        idle limit: a query that keeps producing output is not cut off.
+
+        Raises:
+            asyncio.TimeoutError: If the CLI produces no output for timeout seconds
+            ScoutProcessError: If the CLI exits with a non-zero status
+        """
+        cmd = [self.scout_bin, "query", query]
+        if model:
+            cmd.extend(["--model", model])
+        if verbose:
+            cmd.append("--verbose")
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(cwd),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            # Own process group, so cleanup reaches the Node.js children too
+            start_new_session=hasattr(os, "killpg"),
+        )
+        if hasattr(os, "killpg"):
+            # Killed by the server if a signal ends it while the query runs
+            process_groups.add(process.pid)
+        try:
+            stdout, stderr = await self._collect_output(process, timeout)
+        finally:
+            process_groups.discard(process.pid)
+
+        # stderr is only read on failure - a successful query never decodes it
+        if process.returncode != 0:
+            # OPTIMIZATION: Stay in bytes and decode only the reported tail; the
+            # last non-blank line (stripped output ends in one) is one rfind away
+            error_bytes = stderr.strip()[-_MAX_ERROR_OUTPUT:]
+            last_error = (
+                error_bytes[error_bytes.rfind(b"\n") + 1:].decode("utf-8", errors="replace").strip()
+                or f"scout exited with status {process.returncode}"
+            )
+            raise ScoutProcessError(last_error, error_bytes.decode("utf-8", errors="replace"))
+
+        return stdout.decode("utf-8", errors="replace")
+
+    async def _collect_output(
+        self,
+        process: asyncio.subprocess.Process,
+        timeout: int
+    ) -> tuple[bytearray, bytearray]:
+        """
+        Drain a Scout CLI process's stdout and stderr until it exits.
+
+        Raises:
+            asyncio.TimeoutError: If the CLI produces no output for timeout seconds
+                                  (its process group has been terminated)
+        """
+        loop = asyncio.get_running_loop()
+        stdout = bytearray()
+        stderr = bytearray()
+        last_output = loop.time()
+
+        async def drain(stream: asyncio.StreamReader, buf: bytearray) -> None:
+            nonlocal last_output
+            while True:
+                chunk = await stream.read(_PIPE_READ_SIZE)
+                if not chunk:
+                    return
+                buf += chunk
+                last_output = loop.time()
+
+        readers = asyncio.gather(drain(process.stdout, stdout), drain(process.stderr, stderr))
+        try:
+            # Wait until both pipes hit EOF, pushing the deadline back on each chunk
+            while True:
+                remaining = last_output + timeout - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                done, _ = await asyncio.wait((readers,), timeout=remaining)
+                if done:
+                    break
+            await readers
+            await process.wait()
+        except BaseException:
+            # Timed out, cancelled (e.g. a cancelled background job) or a read failed
+            readers.cancel()
+            try:
+                await readers
+            except (asyncio.CancelledError, Exception):
+                pass
+            await _terminate(process)
+            raise
+
+        return stdout, stderr
+
+
+async def _terminate(process: asyncio.subprocess.Process) -> None:
+    """
+    Stop a Scout CLI process and everything it spawned.
+
+    SIGTERM goes to the whole process group, escalating to SIGKILL after
+    _TERMINATE_GRACE seconds. Killing only the direct child can leave
+    grandchildren running - and holding the output pipes open, which keeps
+    process.wait() from returning.
+    """
+    if not hasattr(os, "killpg"):
+        # No process groups (Windows)
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+        return
+
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        # Group already gone
+        await process.wait()
+        return
+
+    try:
+        await asyncio.wait_for(asyncio.shield(process.wait()), _TERMINATE_GRACE)
+    except asyncio.TimeoutError:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
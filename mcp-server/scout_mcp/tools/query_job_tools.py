@@ -0,0 +1,133 @@
+"""Start/poll variants of the Scout query tool for long-running queries.
+
+A synchronous scout_query holds the MCP request open for the whole query
+(up to its 300s default timeout). MCP has no async callback, so clients with
+shorter request timeouts give up and retry, repeating the work. These tools
+decouple the query from the request: scout_query_start returns a job id
+immediately and scout_query_poll returns the result once the job finishes.
+"""
+
+import time
+from mcp.types import TextContent
+from typing import Dict, Any, List
+from .base_tool import BaseTool, register_tool
+from .ceregrep_query_tool import CeregrepQueryTool
+from ..jobs import job_registry
+
+
+@register_tool
+class ScoutQueryStartTool(CeregrepQueryTool):
+    """Start a Scout query in the background and return a job id."""
+
+    @property
+    def name(self) -> str:
+        return "scout_query_start"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Start a Scout codebase query in the background and return a job_id immediately. "
+            "Use this instead of scout_query for complex queries that may take longer than "
+            "your client's request timeout, then call scout_query_poll with the job_id to "
+            "get the result."
+        )
+
+    async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        query = arguments.get("query", "")
+        effective_cwd = self._resolve_cwd(arguments.get("cwd"))
+
+        error = self._validate(query, effective_cwd)
+        if error:
+            return error
+
+        try:
+            job_id = job_registry.start(
+                self._run_query(
+                    query=query,
+                    cwd=effective_cwd,
+                    model=arguments.get("model"),
+                    verbose=arguments.get("verbose", False),
+                    timeout=arguments.get("timeout", 300)
+                ),
+                description=query
+            )
+        except RuntimeError as e:
+            return [TextContent(type="text", text=f"Error: {e}")]
+
+        return [TextContent(
+            type="text",
+            text=(
+                f"job_id: {job_id}\n"
+                f"status: running\n\n"
+                f"Call scout_query_poll with this job_id to get the result."
+            )
+        )]
+
+
+@register_tool
+class ScoutQueryPollTool(BaseTool):
+    """Check on a background Scout query started with scout_query_start."""
+
+    @property
+    def name(self) -> str:
+        return "scout_query_poll"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Check the status of a Scout query started with scout_query_start. "
+            "Returns the query result once the job has finished, otherwise its "
+            "current status. Set cancel=true to abort a running job."
+        )
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "job_id": {
+                    "type": "string",
+                    "description": "Job id returned by scout_query_start"
+                },
+                "cancel": {
+                    "type": "boolean",
+                    "description": "Cancel the job if it is still running (optional, defaults to false)"
+                }
+            },
+            "required": ["job_id"]
+        }
+
+    async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        job_id = arguments.get("job_id", "")
+        job = job_registry.get(job_id)
+        if job is None:
+            return [TextContent(
+                type="text",
+                text=f"Error: unknown or expired job_id: {job_id}"
+            )]
+
+        if arguments.get("cancel") and job_registry.cancel(job_id):
+            return [TextContent(type="text", text=f"job_id: {job_id}\nstatus: cancelled")]
+
+        if not job.task.done():
+            elapsed = time.monotonic() - job.started_at
+            return [TextContent(
+                type="text",
+                text=(
+                    f"job_id: {job_id}\n"
+                    f"status: running ({elapsed:.0f}s elapsed)\n\n"
+                    f"Poll again later."
+                )
+            )]
+
+        if job.task.cancelled():
+            return [TextContent(type="text", text=f"job_id: {job_id}\nstatus: cancelled")]
+
+        exc = job.task.exception()
+        if exc is not None:
+            return [TextContent(
+                type="text",
+                text=f"job_id: {job_id}\nstatus: failed\n\nError executing Scout: {exc}"
+            )]
+
+        return job.task.result()
@@ -6,11 +6,17 @@ Tests the intelligent caching mechanism that tracks file modification times
 to avoid unnecessary file system scans and module imports.
 """
 
+import atexit
+import itertools
+import os
+import statistics
 import sys
 import time
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, List, Tuple
 
 # Add mcp-server to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -18,6 +24,20 @@ sys.path.insert(0, str(Path(__file__).parent))
 from scout_mcp.tool_discovery import ToolDiscovery
 
 
+# One temporary root for the whole suite, removed at exit; each test gets
+# its own tools directory inside it
+_TEST_ROOT = Path(tempfile.mkdtemp(prefix="scout-tool-caching-"))
+atexit.register(shutil.rmtree, _TEST_ROOT, ignore_errors=True)
+_tools_dir_ids = itertools.count()
+
+
+def new_tools_dir() -> Path:
+    """Create an empty tools directory for one test."""
+    tools_dir = _TEST_ROOT / f"test{next(_tools_dir_ids)}" / "tools"
+    tools_dir.mkdir(parents=True)
+    return tools_dir
+
+
 def create_test_tool(tools_dir: Path, name: str, tool_name: str) -> Path:
     """Create a test tool file."""
     tool_content = f'''
@@ -43,56 +63,65 @@ class {name}(BaseTool):
 '''
 
     tool_file = tools_dir / f"{name.lower()}.py"
-    tool_file.write_text(tool_content)
+    # One open/write/close on raw bytes - no text-mode wrapper per file
+    fd = os.open(tool_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, tool_content.encode())
+    finally:
+        os.close(fd)
     return tool_file
 
 
+def create_test_tools(tools_dir: Path, tools: Iterable[Tuple[str, str]]) -> List[Path]:
+    """Create several test tool files concurrently, given (class name, tool name) pairs."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(lambda tool: create_test_tool(tools_dir, *tool), tools))
+
+
 def test_basic_caching():
     """Test that tools are cached on subsequent calls."""
     print("=" * 60)
     print("TEST 1: Basic Caching")
     print("=" * 60)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tools_dir = Path(tmpdir) / "tools"
-        tools_dir.mkdir()
+    tools_dir = new_tools_dir()
 
-        # Create a test tool
-        create_test_tool(tools_dir, "TestTool1", "test_tool_1")
+    # Create a test tool
+    create_test_tool(tools_dir, "TestTool1", "test_tool_1")
 
-        # Create discovery instance
-        discovery = ToolDiscovery(str(tools_dir))
+    # Create discovery instance
+    discovery = ToolDiscovery(str(tools_dir))
 
-        # First call - should be a cache miss
-        print("First discovery call (cache miss)...")
-        start = time.time()
-        tools1 = discovery.discover_tools()
-        time1 = time.time() - start
+    # First call - should be a cache miss
+    print("First discovery call (cache miss)...")
+    start = time.perf_counter_ns()
+    tools1 = discovery.discover_tools()
+    time1 = time.perf_counter_ns() - start
 
-        stats1 = discovery.get_cache_stats()
-        print(f"  Time: {time1*1000:.2f}ms")
-        print(f"  Tools found: {len(tools1)}")
-        print(f"  Cache stats: {stats1}")
+    stats1 = discovery.get_cache_stats()
+    print(f"  Time: {time1 / 1e6:.2f}ms")
+    print(f"  Tools found: {len(tools1)}")
+    print(f"  Cache stats: {stats1}")
 
-        # Second call - should be a cache hit
-        print("\nSecond discovery call (cache hit)...")
-        start = time.time()
-        tools2 = discovery.discover_tools()
-        time2 = time.time() - start
+    # Second call - should be a cache hit
+    print("\nSecond discovery call (cache hit)...")
+    start = time.perf_counter_ns()
+    tools2 = discovery.discover_tools()
+    time2 = time.perf_counter_ns() - start
 
-        stats2 = discovery.get_cache_stats()
-        print(f"  Time: {time2*1000:.2f}ms")
-        print(f"  Tools found: {len(tools2)}")
-        print(f"  Cache stats: {stats2}")
+    stats2 = discovery.get_cache_stats()
+    print(f"  Time: {time2 / 1e6:.2f}ms")
+    print(f"  Tools found: {len(tools2)}")
+    print(f"  Cache stats: {stats2}")
 
-        # Verify caching worked
-        assert len(tools1) == len(tools2) == 1, "Should find 1 tool"
-        assert stats2['cache_hits'] == 1, "Should have 1 cache hit"
-        assert time2 < time1, f"Cached call should be faster: {time2:.4f}s vs {time1:.4f}s"
+    # Verify caching worked
+    assert len(tools1) == len(tools2) == 1, "Should find 1 tool"
+    assert stats2['cache_hits'] == 1, "Should have 1 cache hit"
+    assert time2 < time1, f"Cached call should be faster: {time2 / 1e6:.3f}ms vs {time1 / 1e6:.3f}ms"
 
-        speedup = time1 / time2 if time2 > 0 else float('inf')
-        print(f"\n✓ Cache speedup: {speedup:.1f}x faster")
-        print(f"✓ Test passed!")
+    speedup = time1 / time2 if time2 > 0 else float('inf')
+    print(f"\n✓ Cache speedup: {speedup:.1f}x faster")
+    print(f"✓ Test passed!")
 
 
 def test_modification_detection():
@@ -101,39 +130,37 @@ def test_modification_detection():
     print("TEST 2: Modification Detection")
     print("=" * 60)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tools_dir = Path(tmpdir) / "tools"
-        tools_dir.mkdir()
+    tools_dir = new_tools_dir()
 
-        # Create a test tool
-        tool_file = create_test_tool(tools_dir, "TestTool2", "test_tool_2")
+    # Create a test tool
+    tool_file = create_test_tool(tools_dir, "TestTool2", "test_tool_2")
 
-        discovery = ToolDiscovery(str(tools_dir))
+    discovery = ToolDiscovery(str(tools_dir))
 
-        # First discovery
-        print("Initial discovery...")
-        tools1 = discovery.discover_tools()
-        print(f"  Found {len(tools1)} tools")
+    # First discovery
+    print("Initial discovery...")
+    tools1 = discovery.discover_tools()
+    print(f"  Found {len(tools1)} tools")
 
-        # Wait a bit to ensure different mtime
-        time.sleep(0.1)
+    # Wait a bit to ensure different mtime
+    time.sleep(0.1)
 
-        # Modify the tool file
-        print("\nModifying tool file...")
-        tool_content = tool_file.read_text()
-        tool_file.write_text(tool_content + "\n# Modified")
+    # Modify the tool file
+    print("\nModifying tool file...")
+    tool_content = tool_file.read_text()
+    tool_file.write_text(tool_content + "\n# Modified")
 
-        # Should detect modification
-        print("Discovery after modification...")
-        tools2 = discovery.discover_tools()
-        stats = discovery.get_cache_stats()
+    # Should detect modification
+    print("Discovery after modification...")
+    tools2 = discovery.discover_tools()
+    stats = discovery.get_cache_stats()
 
-        print(f"  Found {len(tools2)} tools")
-        print(f"  Cache misses: {stats['cache_misses']}")
+    print(f"  Found {len(tools2)} tools")
+    print(f"  Cache misses: {stats['cache_misses']}")
 
-        assert stats['cache_misses'] == 2, "Should have 2 cache misses (initial + modified)"
-        print(f"\n✓ Modification detected correctly")
-        print(f"✓ Test passed!")
+    assert stats['cache_misses'] == 2, "Should have 2 cache misses (initial + modified)"
+    print(f"\n✓ Modification detected correctly")
+    print(f"✓ Test passed!")
 
 
 def test_new_file_detection():
@@ -142,34 +169,32 @@ def test_new_file_detection():
     print("TEST 3: New File Detection")
     print("=" * 60)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tools_dir = Path(tmpdir) / "tools"
-        tools_dir.mkdir()
+    tools_dir = new_tools_dir()
 
-        # Create first tool
-        create_test_tool(tools_dir, "TestTool3a", "test_tool_3a")
+    # Create first tool
+    create_test_tool(tools_dir, "TestTool3a", "test_tool_3a")
 
-        discovery = ToolDiscovery(str(tools_dir))
+    discovery = ToolDiscovery(str(tools_dir))
 
-        # First discovery
-        print("Initial discovery...")
-        tools1 = discovery.discover_tools()
-        print(f"  Found {len(tools1)} tools")
+    # First discovery
+    print("Initial discovery...")
+    tools1 = discovery.discover_tools()
+    print(f"  Found {len(tools1)} tools")
 
-        # Add new tool
-        print("\nAdding new tool file...")
-        create_test_tool(tools_dir, "TestTool3b", "test_tool_3b")
+    # Add new tool
+    print("\nAdding new tool file...")
+    create_test_tool(tools_dir, "TestTool3b", "test_tool_3b")
 
-        # Should detect new file
-        print("Discovery after adding file...")
-        tools2 = discovery.discover_tools()
+    # Should detect new file
+    print("Discovery after adding file...")
+    tools2 = discovery.discover_tools()
 
-        print(f"  Found {len(tools2)} tools")
+    print(f"  Found {len(tools2)} tools")
 
-        assert len(tools1) == 1, "Should initially have 1 tool"
-        assert len(tools2) == 2, "Should now have 2 tools"
-        print(f"\n✓ New file detected correctly")
-        print(f"✓ Test passed!")
+    assert len(tools1) == 1, "Should initially have 1 tool"
+    assert len(tools2) == 2, "Should now have 2 tools"
+    print(f"\n✓ New file detected correctly")
+    print(f"✓ Test passed!")
 
 
 def test_deleted_file_detection():
@@ -178,35 +203,34 @@ def test_deleted_file_detection():
     print("TEST 4: Deleted File Detection")
     print("=" * 60)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tools_dir = Path(tmpdir) / "tools"
-        tools_dir.mkdir()
+    tools_dir = new_tools_dir()
 
-        # Create two tools
-        tool1 = create_test_tool(tools_dir, "TestTool4a", "test_tool_4a")
-        tool2 = create_test_tool(tools_dir, "TestTool4b", "test_tool_4b")
+    # Create two tools
+    tool1, tool2 = create_test_tools(
+        tools_dir, [("TestTool4a", "test_tool_4a"), ("TestTool4b", "test_tool_4b")]
+    )
 
-        discovery = ToolDiscovery(str(tools_dir))
+    discovery = ToolDiscovery(str(tools_dir))
 
-        # First discovery
-        print("Initial discovery...")
-        tools1 = discovery.discover_tools()
-        print(f"  Found {len(tools1)} tools")
+    # First discovery
+    print("Initial discovery...")
+    tools1 = discovery.discover_tools()
+    print(f"  Found {len(tools1)} tools")
 
-        # Delete one tool
-        print("\nDeleting one tool file...")
-        tool1.unlink()
+    # Delete one tool
+    print("\nDeleting one tool file...")
+    tool1.unlink()
 
-        # Should detect deletion
-        print("Discovery after deletion...")
-        tools2 = discovery.discover_tools()
+    # Should detect deletion
+    print("Discovery after deletion...")
+    tools2 = discovery.discover_tools()
 
-        print(f"  Found {len(tools2)} tools")
+    print(f"  Found {len(tools2)} tools")
 
-        assert len(tools1) == 2, "Should initially have 2 tools"
-        assert len(tools2) == 1, "Should now have 1 tool"
-        print(f"\n✓ Deleted file detected correctly")
-        print(f"✓ Test passed!")
+    assert len(tools1) == 2, "Should initially have 2 tools"
+    assert len(tools2) == 1, "Should now have 1 tool"
+    print(f"\n✓ Deleted file detected correctly")
+    print(f"✓ Test passed!")
 
 
 def test_force_reload():
@@ -215,36 +239,34 @@ def test_force_reload():
     print("TEST 5: Force Reload")
     print("=" * 60)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tools_dir = Path(tmpdir) / "tools"
-        tools_dir.mkdir()
+    tools_dir = new_tools_dir()
 
-        create_test_tool(tools_dir, "TestTool5", "test_tool_5")
+    create_test_tool(tools_dir, "TestTool5", "test_tool_5")
 
-        discovery = ToolDiscovery(str(tools_dir))
+    discovery = ToolDiscovery(str(tools_dir))
 
-        # Normal discovery
-        print("Normal discovery...")
-        discovery.discover_tools()
-        stats1 = discovery.get_cache_stats()
-        print(f"  Cache misses: {stats1['cache_misses']}")
+    # Normal discovery
+    print("Normal discovery...")
+    discovery.discover_tools()
+    stats1 = discovery.get_cache_stats()
+    print(f"  Cache misses: {stats1['cache_misses']}")
 
-        # Cached discovery
-        print("\nCached discovery...")
-        discovery.discover_tools()
-        stats2 = discovery.get_cache_stats()
-        print(f"  Cache hits: {stats2['cache_hits']}")
+    # Cached discovery
+    print("\nCached discovery...")
+    discovery.discover_tools()
+    stats2 = discovery.get_cache_stats()
+    print(f"  Cache hits: {stats2['cache_hits']}")
 
-        # Force reload
-        print("\nForce reload...")
-        discovery.discover_tools(force_reload=True)
-        stats3 = discovery.get_cache_stats()
-        print(f"  Cache misses after force: {stats3['cache_misses']}")
+    # Force reload
+    print("\nForce reload...")
+    discovery.discover_tools(force_reload=True)
+    stats3 = discovery.get_cache_stats()
+    print(f"  Cache misses after force: {stats3['cache_misses']}")
 
-        assert stats2['cache_hits'] == 1, "Should have 1 cache hit"
-        assert stats3['cache_misses'] == stats1['cache_misses'] + 1, "Force reload should cause cache miss"
-        print(f"\n✓ Force reload works correctly")
-        print(f"✓ Test passed!")
+    assert stats2['cache_hits'] == 1, "Should have 1 cache hit"
+    assert stats3['cache_misses'] == stats1['cache_misses'] + 1, "Force reload should cause cache miss"
+    print(f"\n✓ Force reload works correctly")
+    print(f"✓ Test passed!")
 
 
 def test_cache_invalidation():
@@ -253,33 +275,31 @@ def test_cache_invalidation():
     print("TEST 6: Cache Invalidation")
     print("=" * 60)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tools_dir = Path(tmpdir) / "tools"
-        tools_dir.mkdir()
+    tools_dir = new_tools_dir()
 
-        create_test_tool(tools_dir, "TestTool6", "test_tool_6")
+    create_test_tool(tools_dir, "TestTool6", "test_tool_6")
 
-        discovery = ToolDiscovery(str(tools_dir))
+    discovery = ToolDiscovery(str(tools_dir))
 
-        # Build cache
-        print("Building cache...")
-        discovery.discover_tools()
-        discovery.discover_tools()  # Cache hit
-        stats1 = discovery.get_cache_stats()
-        print(f"  Cache hits: {stats1['cache_hits']}")
+    # Build cache
+    print("Building cache...")
+    discovery.discover_tools()
+    discovery.discover_tools()  # Cache hit
+    stats1 = discovery.get_cache_stats()
+    print(f"  Cache hits: {stats1['cache_hits']}")
 
-        # Invalidate
-        print("\nInvalidating cache...")
-        discovery.invalidate_cache()
-        stats2 = discovery.get_cache_stats()
-        print(f"  Cache hits after invalidation: {stats2['cache_hits']}")
-        print(f"  Cached tools: {stats2['cached_tools']}")
+    # Invalidate
+    print("\nInvalidating cache...")
+    discovery.invalidate_cache()
+    stats2 = discovery.get_cache_stats()
+    print(f"  Cache hits after invalidation: {stats2['cache_hits']}")
+    print(f"  Cached tools: {stats2['cached_tools']}")
 
-        assert stats1['cache_hits'] > 0, "Should have cache hits before invalidation"
-        assert stats2['cache_hits'] == 0, "Cache stats should be reset"
-        assert stats2['cached_tools'] == 0, "Tools should be cleared"
-        print(f"\n✓ Cache invalidation works correctly")
-        print(f"✓ Test passed!")
+    assert stats1['cache_hits'] > 0, "Should have cache hits before invalidation"
+    assert stats2['cache_hits'] == 0, "Cache stats should be reset"
+    assert stats2['cached_tools'] == 0, "Tools should be cleared"
+    print(f"\n✓ Cache invalidation works correctly")
+    print(f"✓ Test passed!")
 
 
 def test_performance_benchmark():
@@ -288,57 +308,140 @@ def test_performance_benchmark():
     print("TEST 7: Performance Benchmark")
     print("=" * 60)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tools_dir = Path(tmpdir) / "tools"
-        tools_dir.mkdir()
-
-        # Create multiple tools
-        num_tools = 5
-        print(f"Creating {num_tools} test tools...")
-        for i in range(num_tools):
-            create_test_tool(tools_dir, f"TestTool{i}", f"test_tool_{i}")
-
-        discovery = ToolDiscovery(str(tools_dir))
-
-        # Benchmark uncached
-        print("\nBenchmarking uncached discovery...")
-        times_uncached = []
-        for i in range(3):
-            discovery.invalidate_cache()
-            start = time.time()
-            discovery.discover_tools()
-            elapsed = time.time() - start
-            times_uncached.append(elapsed)
-
-        avg_uncached = sum(times_uncached) / len(times_uncached)
-        print(f"  Average uncached time: {avg_uncached*1000:.2f}ms")
-
-        # Benchmark cached
-        print("\nBenchmarking cached discovery...")
-        discovery.discover_tools()  # Warm up cache
-        times_cached = []
-        for i in range(10):
-            start = time.time()
-            discovery.discover_tools()
-            elapsed = time.time() - start
-            times_cached.append(elapsed)
-
-        avg_cached = sum(times_cached) / len(times_cached)
-        print(f"  Average cached time: {avg_cached*1000:.2f}ms")
-
-        # Stats
-        stats = discovery.get_cache_stats()
-        speedup = avg_uncached / avg_cached if avg_cached > 0 else float('inf')
-
-        print(f"\n  Cache statistics:")
-        print(f"    Hit rate: {stats['hit_rate_percent']:.1f}%")
-        print(f"    Cache hits: {stats['cache_hits']}")
-        print(f"    Cache misses: {stats['cache_misses']}")
-        print(f"    Speedup: {speedup:.1f}x faster")
-
-        assert speedup > 2, f"Cache should be at least 2x faster, got {speedup:.1f}x"
-        print(f"\n✓ Performance improvement verified")
-        print(f"✓ Test passed!")
+    tools_dir = new_tools_dir()
+
+    # Create multiple tools
+    num_tools = 5
+    print(f"Creating {num_tools} test tools...")
+    create_test_tools(tools_dir, ((f"TestTool{i}", f"test_tool_{i}") for i in range(num_tools)))
+
+    discovery = ToolDiscovery(str(tools_dir))
+
+    # Timings are integer nanoseconds from perf_counter_ns (monotonic, no
+    # wall-clock jitter); medians keep one GC pause from skewing the result
+
+    # Benchmark uncached
+    print("\nBenchmarking uncached discovery...")
+    times_uncached = []
+    for i in range(3):
+        discovery.invalidate_cache()
+        start = time.perf_counter_ns()
+        discovery.discover_tools()
+        times_uncached.append(time.perf_counter_ns() - start)
+
+    median_uncached = statistics.median(times_uncached)
+    print(f"  Median uncached time: {median_uncached / 1e6:.2f}ms")
+
+    # Benchmark cached
+    print("\nBenchmarking cached discovery...")
+    discovery.discover_tools()  # Warm up cache
+    times_cached = []
+    for i in range(10):
+        start = time.perf_counter_ns()
+        discovery.discover_tools()
+        times_cached.append(time.perf_counter_ns() - start)
+
+    median_cached = statistics.median(times_cached)
+    print(f"  Median cached time: {median_cached / 1e6:.2f}ms")
+
+    # Stats
+    stats = discovery.get_cache_stats()
+    speedup = median_uncached / median_cached if median_cached > 0 else float('inf')
+
+    print(f"\n  Cache statistics:")
+    print(f"    Hit rate: {stats['hit_rate_percent']:.1f}%")
+    print(f"    Cache hits: {stats['cache_hits']}")
+    print(f"    Cache misses: {stats['cache_misses']}")
+    print(f"    Speedup: {speedup:.1f}x faster")
+
+    # Timing-independent check: after the last invalidation only the first
+    # scan loaded modules; the warm-up and every timed call were cache hits
+    assert stats['cache_misses'] == 1, f"Cached calls should not reload modules: {stats}"
+    assert stats['cache_hits'] == 11, f"Every cached call should be a hit: {stats}"
+    assert speedup > 2, f"Cache should be at least 2x faster, got {speedup:.1f}x"
+    print(f"\n✓ Performance improvement verified")
+    print(f"✓ Test passed!")
+
+
+def test_registered_tool_classes():
+    """Test that @register_tool classes are read from the module's _TOOLS list."""
+    print("\n" + "=" * 60)
+    print("TEST 8: Registered Tool Classes")
+    print("=" * 60)
+
+    tools_dir = new_tools_dir()
+
+    # One registered tool plus an unregistered helper subclass
+    (tools_dir / "registered_tool.py").write_text('''
+from scout_mcp.tools.base_tool import BaseTool, register_tool
+from typing import Dict, Any, List
+from mcp.types import TextContent
+
+class _HelperTool(BaseTool):
+    def __init__(self, tool_name: str = "helper_tool"):
+        self._name = tool_name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return "Helper base"
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {"type": "object", "properties": {}, "required": []}
+
+    async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        return [TextContent(type="text", text="Helper result")]
+
+@register_tool
+class RegisteredTool(_HelperTool):
+    def __init__(self):
+        super().__init__("registered_tool")
+''')
+
+    discovery = ToolDiscovery(str(tools_dir))
+
+    print("Discovering tools...")
+    tools = discovery.discover_tools()
+    print(f"  Found tools: {sorted(tools)}")
+
+    assert sorted(tools) == ["registered_tool"], "Only registered classes should be discovered"
+    print(f"\n✓ Registered tool classes discovered correctly")
+    print(f"✓ Test passed!")
+
+
+def test_identical_rewrite_keeps_tools():
+    """Test that rewriting a file with identical contents doesn't reload it."""
+    print("\n" + "=" * 60)
+    print("TEST 9: Identical Rewrite")
+    print("=" * 60)
+
+    tools_dir = new_tools_dir()
+
+    tool_file = create_test_tool(tools_dir, "TestTool9", "test_tool_9")
+
+    discovery = ToolDiscovery(str(tools_dir))
+
+    print("Initial discovery...")
+    tool1 = discovery.discover_tools()["test_tool_9"]
+    stats1 = discovery.get_cache_stats()
+
+    # Rewrite the same bytes - new mtime/ctime, same contents
+    print("\nRewriting file with identical contents...")
+    time.sleep(0.01)
+    tool_file.write_text(tool_file.read_text())
+
+    tool2 = discovery.discover_tools()["test_tool_9"]
+    stats2 = discovery.get_cache_stats()
+    print(f"  Cache misses: {stats1['cache_misses']} -> {stats2['cache_misses']}")
+
+    assert tool2 is tool1, "Identical contents should keep the loaded tool"
+    assert stats2['cache_misses'] == stats1['cache_misses'], "Identical rewrite should not be a cache miss"
+    print(f"\n✓ Identical rewrite detected correctly")
+    print(f"✓ Test passed!")
 
 
 def main():
@@ -355,6 +458,8 @@ def main():
         ("Force Reload", test_force_reload),
         ("Cache Invalidation", test_cache_invalidation),
         ("Performance Benchmark", test_performance_benchmark),
+        ("Registered Tool Classes", test_registered_tool_classes),
+        ("Identical Rewrite", test_identical_rewrite_keeps_tools),
     ]
 
     passed = 0
@@ -4,6 +4,7 @@ Simple test for tool discovery caching without MCP dependencies.
 Tests the core caching logic.
 """
 
+import statistics
 import sys
 import time
 from pathlib import Path
@@ -43,23 +44,23 @@ def test_discover_tools_basic():
 
     # First call
     print("First discovery call...")
-    start = time.time()
+    start = time.perf_counter_ns()
     tools1 = discovery.discover_tools()
-    time1 = time.time() - start
+    time1 = time.perf_counter_ns() - start
 
     stats1 = discovery.get_cache_stats()
-    print(f"  Time: {time1*1000:.2f}ms")
+    print(f"  Time: {time1 / 1e6:.2f}ms")
     print(f"  Tools found: {len(tools1)}")
     print(f"  Stats: {stats1}")
 
     # Second call (should use cache)
     print("\nSecond discovery call (should be cached)...")
-    start = time.time()
+    start = time.perf_counter_ns()
     tools2 = discovery.discover_tools()
-    time2 = time.time() - start
+    time2 = time.perf_counter_ns() - start
 
     stats2 = discovery.get_cache_stats()
-    print(f"  Time: {time2*1000:.2f}ms")
+    print(f"  Time: {time2 / 1e6:.2f}ms")
     print(f"  Tools found: {len(tools2)}")
     print(f"  Stats: {stats2}")
 
@@ -142,21 +143,20 @@ def test_repeated_calls_performance():
     print("Running 10 cached discovery calls...")
     times = []
     for i in range(10):
-        start = time.time()
+        start = time.perf_counter_ns()
         discovery.discover_tools()
-        elapsed = time.time() - start
-        times.append(elapsed)
+        times.append(time.perf_counter_ns() - start)
 
-    avg_time = sum(times) / len(times)
+    median_time = statistics.median(times)
     min_time = min(times)
     max_time = max(times)
 
     stats = discovery.get_cache_stats()
 
     print(f"\n  Results:")
-    print(f"    Average time: {avg_time*1000:.2f}ms")
-    print(f"    Min time: {min_time*1000:.2f}ms")
-    print(f"    Max time: {max_time*1000:.2f}ms")
+    print(f"    Median time: {median_time / 1e6:.2f}ms")
+    print(f"    Min time: {min_time / 1e6:.2f}ms")
+    print(f"    Max time: {max_time / 1e6:.2f}ms")
     print(f"    Hit rate: {stats['hit_rate_percent']:.1f}%")
     print(f"    Total hits: {stats['cache_hits']}")
 
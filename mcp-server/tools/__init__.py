@@ -1 +0,0 @@
-"""MCP tools for ceregrep."""
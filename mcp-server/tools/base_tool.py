@@ -1,40 +0,0 @@
-"""Base tool interface for MCP server tools."""
-
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List
-from mcp.types import Tool, TextContent
-
-
-class BaseTool(ABC):
-    """Base class for MCP tools."""
-    
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Tool name."""
-        pass
-    
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Tool description."""
-        pass
-    
-    @property
-    @abstractmethod
-    def input_schema(self) -> Dict[str, Any]:
-        """JSON schema for tool input."""
-        pass
-    
-    @abstractmethod
-    async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
-        """Execute the tool with given arguments."""
-        pass
-    
-    def to_tool(self) -> Tool:
-        """Convert to MCP Tool object."""
-        return Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema=self.input_schema
-        )
\ No newline at end of file